@@ -1,11 +1,13 @@
 import os
 import shutil
 from datetime import datetime, timedelta
+from functools import cached_property
 from string import Template
 
-from cmlutils.constants import ApiV1Endpoints
-from cmlutils.utils import call_api_v1
+import requests
 
+from cmlutils.constants import ApiV1Endpoints
+from cmlutils.utils import call_api_v1, call_api_v2, parse_json_response
 
 
 class BaseWorkspaceInteractor(object):
@@ -25,7 +27,8 @@ class BaseWorkspaceInteractor(object):
         self.ca_path = ca_path
         self.project_slug = project_slug
 
-    @property
+    # Minted once per interactor, every API v2 call reuses the same key.
+    @cached_property
     def apiv2_key(self) -> str:
         endpoint = Template(ApiV1Endpoints.API_KEY.value).substitute(
             username=self.username
@@ -43,10 +46,34 @@ class BaseWorkspaceInteractor(object):
             json_data=json_data,
             ca_path=self.ca_path,
         )
-        response_dict = response.json()
+        response_dict = parse_json_response(response)
         _apiv2_key = response_dict["apiKey"]
         return _apiv2_key
 
+    def _call_v1(
+        self, endpoint: str, method: str, json_data: dict = None
+    ) -> requests.Response:
+        return call_api_v1(
+            host=self.host,
+            endpoint=endpoint,
+            method=method,
+            api_key=self.api_key,
+            json_data=json_data,
+            ca_path=self.ca_path,
+        )
+
+    def _call_v2(
+        self, endpoint: str, method: str, json_data: dict = None
+    ) -> requests.Response:
+        return call_api_v2(
+            host=self.host,
+            endpoint=endpoint,
+            method=method,
+            user_token=self.apiv2_key,
+            json_data=json_data,
+            ca_path=self.ca_path,
+        )
+
     def remove_cdswctl_dir(self, file_path: str):
         if os.path.exists(file_path):
             dirname = os.path.dirname(file_path)
@@ -2,6 +2,8 @@
 
 """This module defines project-level constants."""
 
+import logging
+import os
 from enum import Enum
 
 CDSW_PROJECTS_ROOT_DIR = "cdsw@localhost:/home/cdsw/"
@@ -21,6 +23,41 @@ OUTPUT_DIR_KEY = "output_dir"
 PROJECT_NAME_KEY = "project_name"
 CA_PATH_KEY = "ca_path"
 MAX_API_PAGE_LENGTH = 30
+MAX_API_V2_PAGE_SIZE = 1000
+# Upper bound on concurrent API calls made while importing project artifacts.
+# Can be lowered through CMLUTILS_MAX_API_WORKERS for rate limited workspaces.
+DEFAULT_MAX_API_WORKERS = 8
+
+
+def _read_max_api_workers() -> int:
+    value = os.environ.get("CMLUTILS_MAX_API_WORKERS")
+    if value is None:
+        return DEFAULT_MAX_API_WORKERS
+    try:
+        return max(1, int(value))
+    except ValueError:
+        # A named logger, so that the root logger is not configured at import
+        # time ahead of the per-project logging setup.
+        logging.getLogger(__name__).warning(
+            "Ignoring invalid CMLUTILS_MAX_API_WORKERS value %r, using %s.",
+            value,
+            DEFAULT_MAX_API_WORKERS,
+        )
+        return DEFAULT_MAX_API_WORKERS
+
+
+MAX_API_WORKERS = _read_max_api_workers()
+# rsync keeps interrupted files here so that a retry resumes instead of restarting.
+# A relative partial dir is excluded from the transfer by rsync itself.
+RSYNC_PARTIAL_DIR = ".rsync-partial"
+RSYNC_IO_TIMEOUT_SECONDS = 60
+FILE_SIZE_CHECK_TIMEOUT_SECONDS = 300
+DOWNLOAD_BUFFER_SIZE = 1024 * 1024
+# All ssh and rsync calls to one forwarded port share a single master connection.
+SSH_CONTROL_PERSIST_SECONDS = 60
+# Starting the endpoint can include pulling the session image.
+SSH_ENDPOINT_START_TIMEOUT_SECONDS = 600
+SSH_ENDPOINT_STOP_TIMEOUT_SECONDS = 5
 
 
 class ApiV2Endpoints(Enum):
@@ -32,15 +69,14 @@ class ApiV2Endpoints(Enum):
     STOP_APP = "/api/v2/projects/$project_id/applications/$application_id:stop"
     CREATE_JOB = "/api/v2/projects/$project_id/jobs"
     UPDATE_JOB = "/api/v2/projects/$project_id/jobs/$job_id"
-    MODELS_LIST = "/api/v2/projects/$project_id/models"
-    JOBS_LIST = "/api/v2/projects/$project_id/jobs"
-    APPS_LIST = "/api/v2/projects/$project_id/applications"
     SEARCH_PROJECT = "/api/v2/projects?search_filter=$search_option&include_public_projects=true&page_size=100000"
-    SEARCH_MODEL = "/api/v2/projects/$project_id/models?search_filter=$search_option&page_size=100000"
-    SEARCH_JOB = "/api/v2/projects/$project_id/jobs?search_filter=$search_option&page_size=100000"
-    SEARCH_APP = "/api/v2/projects/$project_id/applications?search_filter=$search_option&page_size=100000"
     RUNTIME_ADDONS = "/api/v2/runtimeaddons?search_filter=$search_option"
     RUNTIMES = "/api/v2/runtimes?page_size=$page_size&page_token=$page_token"
+    MODELS_PAGE = "/api/v2/projects/$project_id/models?page_size=$page_size&page_token=$page_token"
+    JOBS_PAGE = (
+        "/api/v2/projects/$project_id/jobs?page_size=$page_size&page_token=$page_token"
+    )
+    APPS_PAGE = "/api/v2/projects/$project_id/applications?page_size=$page_size&page_token=$page_token"
 
 
 class ApiV1Endpoints(Enum):
@@ -38,7 +38,13 @@ def get_jobs_metadata_file_path(top_level_dir: str, project_name: str) -> str:
 
 
 def does_directory_exist(dirname: str) -> bool:
-    return os.path.exists(dirname) and os.path.isdir(dirname)
+    # isdir is already False for a missing path, so one stat is enough.
+    return os.path.isdir(dirname)
+
+
+def is_directory_empty(dirname: str) -> bool:
+    with os.scandir(dirname) as entries:
+        return next(entries, None) is None
 
 
 def ensure_project_data_and_metadata_directory_exists(
@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from json import load
 
 #  If the mapping is Empty, the workloads will be created with the default engine images. Hence,
@@ -12,14 +13,16 @@ _LEGACY_ENGINE_RUNTIME_CONSTANTS = {
 }
 
 
+# The mapping is read once per process, callers must treat the result as read-only.
+@lru_cache(maxsize=1)
 def engine_to_runtime_map():
     # make sure this file is generated only via `cmlutil helpers populate_runtimes`
     file_path = (
         os.path.expanduser("~") + "/.cmlutils/legacy_engine_runtime_constants.json"
     )
     if os.path.exists(file_path):
-        data = open(file_path)
-        engine_map = load(data)
+        with open(file_path) as data:
+            engine_map = load(data)
         return engine_map
     else:
         return _LEGACY_ENGINE_RUNTIME_CONSTANTS
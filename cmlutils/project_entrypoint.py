@@ -31,6 +31,7 @@ from cmlutils.utils import (
 from cmlutils.validator import (
     initialize_export_validators,
     initialize_import_validators,
+    run_validators,
 )
 
 
@@ -140,8 +141,7 @@ def project_export_cmd(project_name):
             ca_path=ca_path,
             project_slug=project_slug,
         )
-        for v in validators:
-            validation_response = v.validate()
+        for validation_response in run_validators(validators):
             if validation_response.validation_status == ValidationResponseStatus.FAILED:
                 logging.error(
                     "Validation error: %s",
@@ -250,8 +250,7 @@ def project_import_cmd(project_name, verify):
             ca_path=ca_path,
         )
         logging.info("Begin validating for import.")
-        for v in validators:
-            validation_response = v.validate()
+        for validation_response in run_validators(validators):
             if validation_response.validation_status == ValidationResponseStatus.FAILED:
                 logging.error(
                     "Validation error for project %s: %s",
@@ -408,8 +407,7 @@ def project_import_cmd(project_name, verify):
                     ca_path=export_ca_path,
                     project_slug=export_project_slug,
                 )
-                for v in validators:
-                    validation_response = v.validate()
+                for validation_response in run_validators(validators):
                     if validation_response.validation_status == ValidationResponseStatus.FAILED:
                         logging.error(
                             "Validation error: %s",
@@ -612,7 +610,13 @@ def project_import_cmd(project_name, verify):
     help="Name of project migrated. Make sure the name matches with the section name in import-config.ini and export-config.ini file",
     required=True,
 )
-def project_verify_cmd(project_name):
+@click.option(
+    "--checksum",
+    "-c",
+    is_flag=True,
+    help="Compare project files by checksum instead of size and modification time. Slower, but detects content changes that keep both.",
+)
+def project_verify_cmd(project_name, checksum):
     pexport = None
     validation_data = dict()
     config = _read_config_file(
@@ -671,8 +675,7 @@ def project_verify_cmd(project_name):
             ca_path=export_ca_path,
             project_slug=export_project_slug,
         )
-        for v in validators:
-            validation_response = v.validate()
+        for validation_response in run_validators(validators):
             if validation_response.validation_status == ValidationResponseStatus.FAILED:
                 logging.error(
                     "Validation error: %s",
@@ -739,8 +742,7 @@ def project_verify_cmd(project_name):
                 ca_path=import_ca_path,
             )
             logging.info("Begin validating for import.")
-            for v in validators:
-                validation_response = v.validate()
+            for validation_response in run_validators(validators):
                 if (
                     validation_response.validation_status
                     == ValidationResponseStatus.FAILED
@@ -791,10 +793,12 @@ def project_verify_cmd(project_name):
             # File verification
             logging.info("Project export Verification")
             export_diff_file_list = pexport.verify_project_files(
-                log_filedir=log_filedir
+                log_filedir=log_filedir, use_checksum=checksum
             )
             logging.info("Project import Verification")
-            import_diff_file_list = pimport.verify_project(log_filedir=log_filedir)
+            import_diff_file_list = pimport.verify_project(
+                log_filedir=log_filedir, use_checksum=checksum
+            )
             pimport.terminate_ssh_session()
             logging.info(
                 "No Difference Between Source And Local File Found"
@@ -1,10 +1,11 @@
 import json
 import logging
 import os
-import signal
+import shlex
 import subprocess
+import time
 import urllib.parse
-from encodings import utf_8
+from functools import cached_property, partial
 from string import Template
 from sys import stdout
 from typing import Any
@@ -22,19 +23,43 @@ from cmlutils.directory_utils import (
     get_models_metadata_file_path,
     get_project_data_dir_path,
     get_project_metadata_file_path,
+    is_directory_empty,
+)
+from cmlutils.ssh import (
+    close_ssh_master,
+    open_ssh_endpoint,
+    ssh_command,
+    stop_ssh_endpoint,
 )
-from cmlutils.ssh import open_ssh_endpoint
 from cmlutils.utils import (
+    FlattenedView,
+    build_runtime_id_map,
+    build_runtime_index,
     call_api_v1,
-    call_api_v2,
     extract_fields,
-    find_runtime,
-    flatten_json_data,
+    find_runtime_by_id,
     get_best_runtime,
+    parse_json_response,
     read_json_file,
+    run_concurrently,
     write_json_file,
 )
 
+# Parsed once at import instead of on every API call.
+_API_V1_TEMPLATES = {endpoint: Template(endpoint.value) for endpoint in ApiV1Endpoints}
+_API_V2_TEMPLATES = {endpoint: Template(endpoint.value) for endpoint in ApiV2Endpoints}
+
+
+def _encode_search_option(search_option: dict) -> str:
+    return urllib.parse.quote(json.dumps(search_option, separators=(",", ":")), safe="")
+
+
+# The Spark add-on search never changes, so its endpoint is built once.
+_SPARK_ADDON_ENDPOINT = _API_V2_TEMPLATES[ApiV2Endpoints.RUNTIME_ADDONS].substitute(
+    search_option=_encode_search_option(
+        {"identifier": constants.SPARK_ADDON, "status": "AVAILABLE"}
+    )
+)
 
 
 def is_project_configured_with_runtimes(
@@ -45,13 +70,13 @@ def is_project_configured_with_runtimes(
     ca_path: str,
     project_slug: str,
 ) -> bool:
-    endpoint = Template(ApiV1Endpoints.PROJECT.value).substitute(
+    endpoint = _API_V1_TEMPLATES[ApiV1Endpoints.PROJECT].substitute(
         username=username, project_name=project_slug
     )
     response = call_api_v1(
         host=host, endpoint=endpoint, method="GET", api_key=api_key, ca_path=ca_path
     )
-    response_dict = response.json()
+    response_dict = parse_json_response(response)
     return (
         str(response_dict.get("default_project_engine_type", "")).lower()
         == "ml_runtime"
@@ -68,9 +93,11 @@ def get_ignore_files(
     project_slug: str,
     top_level_dir: str,
 ) -> str:
-    endpoint = Template(ApiV1Endpoints.PROJECT_FILE.value).substitute(
+    endpoint = _API_V1_TEMPLATES[ApiV1Endpoints.PROJECT_FILE].substitute(
         username=username, project_name=project_slug, filename=constants.FILE_NAME
     )
+    ignore_path = os.path.join(top_level_dir, project_name, constants.IGNORE_FILE_PATH)
+    encoding = "utf-8"
     try:
         logging.info(
             "The files included in %s will not be migrated for the project %s",
@@ -80,18 +107,12 @@ def get_ignore_files(
         response = call_api_v1(
             host=host, endpoint=endpoint, method="GET", api_key=api_key, ca_path=ca_path
         )
-        a = response.text + "\n" + constants.FILE_NAME
-        with open(
-            os.path.join(top_level_dir, project_name, constants.IGNORE_FILE_PATH),
-            "w",
-            encoding=utf_8.getregentry().name,
-        ) as f:
-            f.writelines(a.strip())
+        a = response.content.decode(encoding) + "\n" + constants.FILE_NAME
+        with open(ignore_path, "w", encoding=encoding) as f:
+            f.write(a.strip())
         # Set file permissions to 600 (read and write only for the owner)
-        os.chmod(
-            os.path.join(top_level_dir, project_name, constants.IGNORE_FILE_PATH), 0o600
-        )
-        return os.path.join(top_level_dir, project_name, constants.IGNORE_FILE_PATH)
+        os.chmod(ignore_path, 0o600)
+        return ignore_path
     except HTTPError as e:
         if e.response.status_code == 404:
             logging.warning(
@@ -103,38 +124,41 @@ def get_ignore_files(
                 constants.FILE_NAME,
             )
             entries_content = "\n".join(constants.DEFAULT_ENTRIES)
-            create_command = [
-                "ssh",
-                "-p",
-                str(ssh_port),
-                "-oStrictHostKeyChecking=no",
+            # printf behaves the same in every POSIX shell, unlike echo -e
+            quoted_entries = " ".join(map(shlex.quote, constants.DEFAULT_ENTRIES))
+            create_command = ssh_command(ssh_port) + [
                 constants.CDSW_ROOT_USER,
-                f"echo -e '{entries_content}' > {constants.FILE_NAME}",
+                f"printf '%s\\n' {quoted_entries} > {shlex.quote(constants.FILE_NAME)}",
             ]
             subprocess.run(create_command)
             entries_content = entries_content + "\n" + constants.FILE_NAME
-            with open(
-                os.path.join(top_level_dir, project_name, constants.IGNORE_FILE_PATH),
-                "w",
-                encoding=utf_8.getregentry().name,
-            ) as f:
-                f.writelines(entries_content.strip())
+            with open(ignore_path, "w", encoding=encoding) as f:
+                f.write(entries_content.strip())
             # Set file permissions to 600 (read and write only for the owner)
-            os.chmod(
-                os.path.join(top_level_dir, project_name, constants.IGNORE_FILE_PATH),
-                0o600,
-            )
-            return os.path.join(top_level_dir, project_name, constants.IGNORE_FILE_PATH)
+            os.chmod(ignore_path, 0o600)
+            return ignore_path
         else:
             logging.error("Failed to find ignore files due to network issues.")
             raise e
 
 
+# The validators and the exporter/importer each look up the rsync runtime for
+# the same workspace during one run, so only the first lookup hits the API.
+# The runtime catalog belongs to the workspace, so the API key is not part of
+# the cache key. Only a found runtime is remembered: one may be added while the
+# tool runs, and a failed lookup is retried on the next call.
+_rsync_runtime_ids = {}
+
+
 def get_rsync_enabled_runtime_id(host: str, api_key: str, ca_path: str) -> int:
+    lookup_key = (host, ca_path)
+    if lookup_key in _rsync_runtime_ids:
+        return _rsync_runtime_ids[lookup_key]
     runtime_list = get_cdsw_runtimes(host=host, api_key=api_key, ca_path=ca_path)
     for runtime in runtime_list:
         if "rsync" in runtime["edition"].lower():
             logging.info("Rsync enabled runtime is available.")
+            _rsync_runtime_ids[lookup_key] = runtime["id"]
             return runtime["id"]
     logging.info("Rsync enabled runtime is not available")
     return -1
@@ -145,7 +169,7 @@ def get_cdsw_runtimes(host: str, api_key: str, ca_path: str) -> list[dict[str, A
     response = call_api_v1(
         host=host, endpoint=endpoint, method="GET", api_key=api_key, ca_path=ca_path
     )
-    response_dict = response.json()
+    response_dict = parse_json_response(response)
     return response_dict["runtimes"]
 
 
@@ -157,10 +181,11 @@ def transfer_project_files(
     project_name: str,
     log_filedir: str,
     exclude_file_path: str = None,
+    whole_file: bool = False,
 ):
     log_filename = log_filedir + constants.LOG_FILE
     logging.info("Transfering files over ssh from sshport %s", sshport)
-    ssh_directive = f"ssh -p {sshport} -oStrictHostKeyChecking=no"
+    ssh_directive = " ".join(ssh_command(sshport))
     subprocess_arguments = [
         "rsync",
         "--delete",
@@ -169,11 +194,16 @@ def transfer_project_files(
         "-v",
         "-i",
         "-a",
+        f"--partial-dir={constants.RSYNC_PARTIAL_DIR}",
+        f"--timeout={constants.RSYNC_IO_TIMEOUT_SECONDS}",
         "-e",
         ssh_directive,
         "--log-file",
         log_filename,
     ]
+    if whole_file:
+        # With nothing at the destination the delta algorithm has no basis to use.
+        subprocess_arguments.append("--whole-file")
     if exclude_file_path is not None:
         logging.info("Exclude file path is provided for file transfer")
         subprocess_arguments.append(f"--exclude-from={exclude_file_path}")
@@ -184,6 +214,9 @@ def transfer_project_files(
             logging.info("Project files transfered successfully")
             return
         logging.warning("Got non zero return code. Retrying...")
+        if i + 1 < retry_limit:
+            # Back off so a transient ssh or network failure has time to clear.
+            time.sleep(2**i)
     if return_code != 0:
         logging.error(
             "Retries exhausted for rsync.. Failing script for project %s", project_name
@@ -191,6 +224,25 @@ def transfer_project_files(
         raise RuntimeError("Retries exhausted for rsync.. Failing script")
 
 
+def _parse_verify_output(output: str) -> list:
+    """Returns the changed names from rsync --out-format=%n output.
+
+    Each line may be prefixed by "deleting " and "./". Empty names and dot files
+    such as .local and .cache are skipped.
+    """
+    file_list = []
+    for line in output.split("\n"):
+        name = line.strip()
+        if name.startswith("deleting "):
+            name = name[len("deleting ") :]
+        if name.startswith("./"):
+            name = name[2:]
+        name = name.replace(" ", "").replace("\t", "")
+        if name != "" and not name.startswith("."):
+            file_list.append(name)
+    return file_list
+
+
 def verify_files(
     sshport: int,
     source: str,
@@ -199,15 +251,15 @@ def verify_files(
     project_name: str,
     log_filedir: str,
     exclude_file_path: str = None,
+    use_checksum: bool = False,
 ):
     log_filename = log_filedir + constants.LOG_FILE
     logging.info("Validating files over ssh from sshport %s", sshport)
-    ssh_directive = f"ssh -p {sshport} -oStrictHostKeyChecking=no"
+    ssh_directive = " ".join(ssh_command(sshport))
     subprocess_arguments = [
         "rsync",
         "-n",
         "-r",
-        "-c",
         "-a",
         "--delete",
         "--itemize-changes",
@@ -217,6 +269,8 @@ def verify_files(
         "--log-file",
         log_filename,
     ]
+    if use_checksum:
+        subprocess_arguments.append("-c")
     if exclude_file_path is not None:
         logging.info("Exclude file path is provided for file Verification")
         subprocess_arguments.append(f"--exclude-from={exclude_file_path}")
@@ -226,25 +280,11 @@ def verify_files(
             subprocess_arguments, stdout=subprocess.PIPE, stderr=subprocess.PIPE
         )
         if result.returncode == 0:
-            # Removing any . files
-            file_list = (
-                result.stdout.decode("utf-8")
-                .strip()
-                .replace(" ", "")
-                .replace("./", "")
-                .replace("deleting", "")
-                .replace("\t", "")
-                .split("\n")
-            )
-            # Use list comprehension to remove empty strings and .local and ,cache files
-            filtered_list = [
-                file
-                for file in file_list
-                if (file != "" and
-                    not file.startswith('.'))
-                 ]
-            return filtered_list
+            return _parse_verify_output(result.stdout.decode("utf-8"))
         logging.warning("Got non zero return code. Retrying...")
+        if i + 1 < retry_limit:
+            # Back off so a transient ssh or network failure has time to clear.
+            time.sleep(2**i)
     if result.returncode != 0:
         logging.error(
             "Retries exhausted for rsync.. Failing script for project %s", project_name
@@ -252,23 +292,60 @@ def verify_files(
         raise RuntimeError("Retries exhausted for rsync.. Failing script")
 
 
-def test_file_size(sshport: int, output_dir: str, exclude_file_path: str = None):
+def test_file_size(
+    sshport: int,
+    output_dir: str,
+    exclude_file_path: str = None,
+    timeout: int = constants.FILE_SIZE_CHECK_TIMEOUT_SECONDS,
+):
+    s = os.statvfs(output_dir)
+    localdir_size = s.f_bavail * s.f_frsize // 1024
     if exclude_file_path != None:
-        command = f"ssh -p {sshport} -oStrictHostKeyChecking=no {constants.CDSW_ROOT_USER} \"du -sh -k --exclude-from='{constants.EXCLUDE_FILE_ROOT_PATH}'\""
+        du_command = f"du -sk --exclude-from='{constants.EXCLUDE_FILE_ROOT_PATH}' ."
     else:
-        command = f'ssh -p {sshport} -oStrictHostKeyChecking=no {constants.CDSW_ROOT_USER} "du -sh -k ."'
-    output = subprocess.check_output(command, shell=True).decode("utf-8").strip()
-    # Extract the file size from the output
-    file_size = output.split("\t")[0]
-    s = os.statvfs(output_dir)
-    localdir_size = (s.f_bavail * s.f_frsize) / 1024
-    if float(file_size) > float(localdir_size):
+        du_command = "du -sk ."
+    command = ssh_command(sshport) + [constants.CDSW_ROOT_USER, du_command]
+    try:
+        output = (
+            subprocess.check_output(command, timeout=timeout).decode("utf-8").strip()
+        )
+    except subprocess.TimeoutExpired:
+        # The check is only an early warning, rsync fails on its own if the disk fills up.
+        logging.warning(
+            "Project size could not be computed within %s seconds. Skipping the disk space check.",
+            timeout,
+        )
+        return
+    # Extract the size in KiB from the "<size>\t<path>" output
+    file_size = int(output.split(None, 1)[0])
+    if file_size > localdir_size:
         logging.error(
             "Insufficient disk storage to download project files for the project."
         )
         raise RuntimeError
 
 
+def _dedupe_by_key(items: list, key) -> tuple[list, list, list]:
+    """Splits items into the first item per key and the later duplicates.
+
+    Also returns, for every item, the index in the unique list of the first
+    item with the same key.
+    """
+    unique = []
+    duplicates = []
+    positions = []
+    index_by_key = {}
+    for item in items:
+        item_key = key(item)
+        if item_key in index_by_key:
+            duplicates.append(item)
+        else:
+            index_by_key[item_key] = len(unique)
+            unique.append(item)
+        positions.append(index_by_key[item_key])
+    return unique, duplicates, positions
+
+
 class ProjectExporter(BaseWorkspaceInteractor):
     def __init__(
         self,
@@ -282,6 +359,7 @@ class ProjectExporter(BaseWorkspaceInteractor):
         owner_type: str,
     ) -> None:
         self._ssh_subprocess = None
+        self._ssh_port = None
         self.top_level_dir = top_level_dir
         self.project_id = None
         self.owner_type = owner_type
@@ -290,53 +368,50 @@ class ProjectExporter(BaseWorkspaceInteractor):
 
     # Get CDSW project info using API v1
     def get_project_infov1(self):
-        endpoint = Template(ApiV1Endpoints.PROJECT.value).substitute(
+        endpoint = _API_V1_TEMPLATES[ApiV1Endpoints.PROJECT].substitute(
             username=self.username, project_name=self.project_slug
         )
-        response = call_api_v1(
-            host=self.host,
-            endpoint=endpoint,
-            method="GET",
-            api_key=self.api_key,
-            ca_path=self.ca_path,
-        )
-        return response.json()
+        response = self._call_v1(endpoint=endpoint, method="GET")
+        return parse_json_response(response)
 
     # Get CDSW project env variables using API v1
     def get_project_env(self):
-        endpoint = Template(ApiV1Endpoints.PROJECT_ENV.value).substitute(
+        endpoint = _API_V1_TEMPLATES[ApiV1Endpoints.PROJECT_ENV].substitute(
             username=self.username, project_name=self.project_slug
         )
-        response = call_api_v1(
-            host=self.host,
-            endpoint=endpoint,
-            method="GET",
-            api_key=self.api_key,
-            ca_path=self.ca_path,
-        )
-        return response.json()
+        response = self._call_v1(endpoint=endpoint, method="GET")
+        return parse_json_response(response)
+
+    # Runtimes don't change during a run; shared by the model and job exports.
+    @cached_property
+    def _runtime_list(self):
+        return self.get_all_runtimes()
+
+    @cached_property
+    def _runtime_by_id(self):
+        return build_runtime_id_map(self._runtime_list["runtimes"])
+
+    # Shared by the project and application exports; treat as read-only.
+    @cached_property
+    def _project_env(self):
+        return self.get_project_env()
 
     def get_creator_username(self):
         next_page_exists = True
         offset = 0
-        project_list = []
+        previous_page = None
 
         # Handle Pagination if exists
         while next_page_exists:
             # Note - projectName param makes LIKE query not the exact match
-            endpoint = Template(ApiV1Endpoints.PROJECTS_SUMMARY.value).substitute(
+            endpoint = _API_V1_TEMPLATES[ApiV1Endpoints.PROJECTS_SUMMARY].substitute(
                 username=self.username,
                 projectName=self.project_name,
                 limit=constants.MAX_API_PAGE_LENGTH,
                 offset=offset * constants.MAX_API_PAGE_LENGTH,
             )
-            response = call_api_v1(
-                host=self.host,
-                endpoint=endpoint,
-                method="GET",
-                api_key=self.api_key,
-                ca_path=self.ca_path,
-            )
+            response = self._call_v1(endpoint=endpoint, method="GET")
+            page = parse_json_response(response)
 
             """
             End loop            
@@ -346,18 +421,11 @@ class ProjectExporter(BaseWorkspaceInteractor):
             b. If length of response is greater than MAX_API_PAGE_LENGTH => If source is CDSW, as CDSW doesn't honor limit
             c. If CDSW non-paginated response length is exactly the MAX_API_PAGE_LENGTH
             """
-            if len(response.json()) != constants.MAX_API_PAGE_LENGTH:
-                next_page_exists = False
-            else:
-                # Handling if CDSW non-paginated response length is MAX_API_PAGE_LENGTH
-                if project_list == response.json():
-                    break
-
-            project_list = project_list + response.json()
-            offset = offset + 1
+            # Handling if CDSW non-paginated response length is MAX_API_PAGE_LENGTH
+            if page == previous_page:
+                break
 
-        if project_list:
-            for project in project_list:
+            for project in page:
                 if project["name"] == self.project_name:
                     if project["owner"]["type"] == constants.ORGANIZATION_TYPE:
                         return (
@@ -371,6 +439,12 @@ class ProjectExporter(BaseWorkspaceInteractor):
                             project["slug_raw"],
                             constants.USER_TYPE,
                         )
+
+            if len(page) != constants.MAX_API_PAGE_LENGTH:
+                next_page_exists = False
+            previous_page = page
+            offset = offset + 1
+
         return None, None, None
 
     # Get all models list info using API v1
@@ -381,43 +455,24 @@ class ProjectExporter(BaseWorkspaceInteractor):
             "latestModelDeployment": True,
             "latestModelBuild": True,
         }
-        response = call_api_v1(
-            host=self.host,
-            endpoint=endpoint,
-            method="POST",
-            api_key=self.api_key,
-            json_data=json_data,
-            ca_path=self.ca_path,
-        )
-        return response.json()
+        response = self._call_v1(endpoint=endpoint, method="POST", json_data=json_data)
+        return parse_json_response(response)
 
     # Get all jobs list info using API v1
     def get_jobs_listv1(self):
-        endpoint = Template(ApiV1Endpoints.JOBS_LIST.value).substitute(
+        endpoint = _API_V1_TEMPLATES[ApiV1Endpoints.JOBS_LIST].substitute(
             username=self.username, project_name=self.project_slug
         )
-        response = call_api_v1(
-            host=self.host,
-            endpoint=endpoint,
-            method="GET",
-            api_key=self.api_key,
-            ca_path=self.ca_path,
-        )
-        return response.json()
+        response = self._call_v1(endpoint=endpoint, method="GET")
+        return parse_json_response(response)
 
     # Get all applications list info using API v1
     def get_app_listv1(self):
-        endpoint = Template(ApiV1Endpoints.APPS_LIST.value).substitute(
+        endpoint = _API_V1_TEMPLATES[ApiV1Endpoints.APPS_LIST].substitute(
             username=self.username, project_name=self.project_slug
         )
-        response = call_api_v1(
-            host=self.host,
-            endpoint=endpoint,
-            method="GET",
-            api_key=self.api_key,
-            ca_path=self.ca_path,
-        )
-        return response.json()
+        response = self._call_v1(endpoint=endpoint, method="GET")
+        return parse_json_response(response)
 
     # Get CDSW model info using API v1
     def get_model_infov1(self, model_id: str):
@@ -427,64 +482,34 @@ class ProjectExporter(BaseWorkspaceInteractor):
             "latestModelDeployment": True,
             "latestModelBuild": True,
         }
-        response = call_api_v1(
-            host=self.host,
-            endpoint=endpoint,
-            method="POST",
-            api_key=self.api_key,
-            json_data=json_data,
-            ca_path=self.ca_path,
-        )
-        return response.json()
+        response = self._call_v1(endpoint=endpoint, method="POST", json_data=json_data)
+        return parse_json_response(response)
 
     # Get Job info using API v1
     def get_job_infov1(self, job_id: int):
-        endpoint = Template(ApiV1Endpoints.JOB_INFO.value).substitute(
+        endpoint = _API_V1_TEMPLATES[ApiV1Endpoints.JOB_INFO].substitute(
             username=self.username, project_name=self.project_slug, job_id=job_id
         )
-        response = call_api_v1(
-            host=self.host,
-            endpoint=endpoint,
-            method="GET",
-            api_key=self.api_key,
-            ca_path=self.ca_path,
-        )
-        return response.json()
+        response = self._call_v1(endpoint=endpoint, method="GET")
+        return parse_json_response(response)
 
     # Get application info using API v1
     def get_app_infov1(self, app_id: int):
-        endpoint = Template(ApiV1Endpoints.APP_INFO.value).substitute(
+        endpoint = _API_V1_TEMPLATES[ApiV1Endpoints.APP_INFO].substitute(
             username=self.username, project_name=self.project_name, app_id=app_id
         )
-        response = call_api_v1(
-            host=self.host,
-            endpoint=endpoint,
-            method="GET",
-            api_key=self.api_key,
-            ca_path=self.ca_path,
-        )
-        return response.json()
+        response = self._call_v1(endpoint=endpoint, method="GET")
+        return parse_json_response(response)
 
     # Get all runtimes using API v1
     def get_all_runtimes(self):
         endpoint = ApiV1Endpoints.RUNTIMES.value
-        response = call_api_v1(
-            host=self.host,
-            endpoint=endpoint,
-            method="GET",
-            api_key=self.api_key,
-            ca_path=self.ca_path,
-        )
-        return response.json()
+        response = self._call_v1(endpoint=endpoint, method="GET")
+        return parse_json_response(response)
 
-    def terminate_ssh_session(self):
-        logging.info("Terminating ssh connection.")
-        if self._ssh_subprocess is not None:
-            self._ssh_subprocess.send_signal(signal.SIGINT)
-        self._ssh_subprocess = None
-
-    def transfer_project_files(self, log_filedir: str):
-        rsync_enabled_runtime_id = -1
+    # Shared by transfer_project_files and verify_project_files.
+    @cached_property
+    def _rsync_runtime_id(self) -> int:
         if is_project_configured_with_runtimes(
             host=self.host,
             username=self.username,
@@ -493,9 +518,22 @@ class ProjectExporter(BaseWorkspaceInteractor):
             ca_path=self.ca_path,
             project_slug=self.project_slug,
         ):
-            rsync_enabled_runtime_id = get_rsync_enabled_runtime_id(
+            return get_rsync_enabled_runtime_id(
                 host=self.host, api_key=self.api_key, ca_path=self.ca_path
             )
+        return -1
+
+    def terminate_ssh_session(self):
+        logging.info("Terminating ssh connection.")
+        if self._ssh_port is not None:
+            close_ssh_master(self._ssh_port)
+        if self._ssh_subprocess is not None:
+            stop_ssh_endpoint(self._ssh_subprocess)
+        self._ssh_subprocess = None
+        self._ssh_port = None
+
+    def transfer_project_files(self, log_filedir: str):
+        rsync_enabled_runtime_id = self._rsync_runtime_id
         cdswctl_path = obtain_cdswctl(host=self.host, ca_path=self.ca_path)
         login_response = cdswctl_login(
             cdswctl_path=cdswctl_path,
@@ -509,6 +547,8 @@ class ProjectExporter(BaseWorkspaceInteractor):
         project_data_dir, _ = ensure_project_data_and_metadata_directory_exists(
             self.top_level_dir, self.project_name
         )
+        # A first export has nothing locally to compute deltas against.
+        whole_file = is_directory_empty(project_data_dir)
 
         logging.info("Creating SSH connection")
         ssh_subprocess, port = open_ssh_endpoint(
@@ -518,6 +558,7 @@ class ProjectExporter(BaseWorkspaceInteractor):
             project_slug=self.project_slug,
         )
         self._ssh_subprocess = ssh_subprocess
+        self._ssh_port = port
         exclude_file_path = get_ignore_files(
             host=self.host,
             username=self.username,
@@ -541,23 +582,13 @@ class ProjectExporter(BaseWorkspaceInteractor):
             project_name=self.project_name,
             exclude_file_path=exclude_file_path,
             log_filedir=log_filedir,
+            whole_file=whole_file,
         )
         self.remove_cdswctl_dir(cdswctl_path)
         self.terminate_ssh_session()
 
-    def verify_project_files(self, log_filedir: str):
-        rsync_enabled_runtime_id = -1
-        if is_project_configured_with_runtimes(
-            host=self.host,
-            username=self.username,
-            project_name=self.project_name,
-            api_key=self.api_key,
-            ca_path=self.ca_path,
-            project_slug=self.project_slug,
-        ):
-            rsync_enabled_runtime_id = get_rsync_enabled_runtime_id(
-                host=self.host, api_key=self.api_key, ca_path=self.ca_path
-            )
+    def verify_project_files(self, log_filedir: str, use_checksum: bool = False):
+        rsync_enabled_runtime_id = self._rsync_runtime_id
         cdswctl_path = obtain_cdswctl(host=self.host, ca_path=self.ca_path)
         login_response = cdswctl_login(
             cdswctl_path=cdswctl_path,
@@ -577,6 +608,7 @@ class ProjectExporter(BaseWorkspaceInteractor):
             project_slug=self.project_slug,
         )
         self._ssh_subprocess = ssh_subprocess
+        self._ssh_port = port
         exclude_file_path = get_ignore_files(
             host=self.host,
             username=self.username,
@@ -600,6 +632,7 @@ class ProjectExporter(BaseWorkspaceInteractor):
             project_name=self.project_name,
             exclude_file_path=exclude_file_path,
             log_filedir=log_filedir,
+            use_checksum=use_checksum,
         )
         self.remove_cdswctl_dir(cdswctl_path)
         self.terminate_ssh_session()
@@ -611,10 +644,10 @@ class ProjectExporter(BaseWorkspaceInteractor):
         )
         logging.info("Exporting project metadata to path %s", filepath)
         project_info_resp = self.get_project_infov1()
-        project_env = self.get_project_env()
+        project_env = dict(self._project_env)
         if "CDSW_APP_POLLING_ENDPOINT" not in project_env:
             project_env["CDSW_APP_POLLING_ENDPOINT"] = "."
-        project_info_flatten = flatten_json_data(project_info_resp)
+        project_info_flatten = FlattenedView(project_info_resp)
         project_metadata = extract_fields(project_info_flatten, constants.PROJECT_MAP)
 
         if project_info_flatten[
@@ -647,17 +680,18 @@ class ProjectExporter(BaseWorkspaceInteractor):
         model_name_list = []
         if len(model_list) == 0:
             logging.info("Models are not present in the project %s.", self.project_name)
-        runtime_list = self.get_all_runtimes()
+        runtime_by_id = self._runtime_by_id
+        engine_map = legacy_engine_runtime_constants.engine_to_runtime_map()
         model_metadata_list = []
         for model in model_list:
-            model_info_flatten = flatten_json_data(model)
+            model_info_flatten = FlattenedView(model)
             model_metadata = extract_fields(model_info_flatten, constants.MODEL_MAP)
             model_name_list.append(model_metadata["name"])
             if "authEnabled" in model:
                 model_metadata["disable_authentication"] = not model["authEnabled"]
             if "latestModelBuild.runtimeId" in model_info_flatten:
-                runtime_obj = find_runtime(
-                    runtime_list=runtime_list["runtimes"],
+                runtime_obj = find_runtime_by_id(
+                    runtime_by_id=runtime_by_id,
                     runtime_id=model_info_flatten["latestModelBuild.runtimeId"],
                 )
                 if runtime_obj != None:
@@ -670,19 +704,15 @@ class ProjectExporter(BaseWorkspaceInteractor):
                     # We are expecting LEGACY_ENGINE_MAP if the user want to migrate from an engine to runtime,
                     # and the mapping should be given in LEGACY_ENGINE_MAP
                     # If the mapping is not given/empty, the workloads will be created with the default engine images.
-                    if bool(legacy_engine_runtime_constants.engine_to_runtime_map()):
+                    if bool(engine_map):
                         if model_info_flatten["latestModelBuild.kernel"] != "":
-                            runtime_identifier = legacy_engine_runtime_constants.engine_to_runtime_map().get(
+                            runtime_identifier = engine_map.get(
                                 model_info_flatten["latestModelBuild.kernel"],
-                                legacy_engine_runtime_constants.engine_to_runtime_map().get(
-                                    "default"
-                                ),
+                                engine_map.get("default"),
                             )
                             model_metadata["runtime_identifier"] = runtime_identifier
                         else:
-                            model_metadata[
-                                "runtime_identifier"
-                            ] = legacy_engine_runtime_constants.engine_to_runtime_map().get(
+                            model_metadata["runtime_identifier"] = engine_map.get(
                                 "default"
                             )
                     else:
@@ -691,16 +721,15 @@ class ProjectExporter(BaseWorkspaceInteractor):
                                 "latestModelBuild.kernel"
                             ]
                         else:
-                            model_metadata[
-                                "runtime_identifier"
-                            ] = legacy_engine_runtime_constants.engine_to_runtime_map().get(
+                            model_metadata["runtime_identifier"] = engine_map.get(
                                 "default"
                             )
 
             model_metadata_list.append(model_metadata)
         write_json_file(file_path=filepath, json_data=model_metadata_list)
         self.metrics_data["total_model"] = len(model_name_list)
-        self.metrics_data["model_name_list"] = sorted(model_name_list)
+        model_name_list.sort()
+        self.metrics_data["model_name_list"] = model_name_list
 
     def _export_application_metadata(self):
         filepath = get_applications_metadata_file_path(
@@ -714,8 +743,9 @@ class ProjectExporter(BaseWorkspaceInteractor):
                 "Applications are not present in the project %s.", self.project_name
             )
         app_metadata_list = []
+        engine_map = legacy_engine_runtime_constants.engine_to_runtime_map()
         for app in app_list:
-            app_info_flatten = flatten_json_data(app)
+            app_info_flatten = FlattenedView(app)
             app_metadata = extract_fields(app_info_flatten, constants.APPLICATION_MAP)
             app_name_list.append(app_metadata["name"])
             app_metadata["environment"] = app["environment"]
@@ -726,14 +756,10 @@ class ProjectExporter(BaseWorkspaceInteractor):
                 # We are expecting LEGACY_ENGINE_MAP if the user want to migrate from an engine to runtime,
                 # and the mapping should be given in LEGACY_ENGINE_MAP
                 # If the mapping is not given, the workloads will be created with the default engine images.
-                if bool(legacy_engine_runtime_constants.engine_to_runtime_map()):
-                    runtime_identifier = (
-                        legacy_engine_runtime_constants.engine_to_runtime_map().get(
-                            app_info_flatten["currentDashboard.kernel"],
-                            legacy_engine_runtime_constants.engine_to_runtime_map().get(
-                                "default"
-                            ),
-                        )
+                if bool(engine_map):
+                    runtime_identifier = engine_map.get(
+                        app_info_flatten["currentDashboard.kernel"],
+                        engine_map.get("default"),
                     )
                     app_metadata["runtime_identifier"] = runtime_identifier
                 else:
@@ -742,7 +768,8 @@ class ProjectExporter(BaseWorkspaceInteractor):
 
         write_json_file(file_path=filepath, json_data=app_metadata_list)
         self.metrics_data["total_application"] = len(app_metadata_list)
-        self.metrics_data["application_name_list"] = sorted(app_name_list)
+        app_name_list.sort()
+        self.metrics_data["application_name_list"] = app_name_list
 
     def collect_export_job_list(self):
         job_list = self.get_jobs_listv1()
@@ -750,14 +777,15 @@ class ProjectExporter(BaseWorkspaceInteractor):
         if len(job_list) == 0:
             logging.info("Jobs are not present in the project %s.", self.project_name)
         else:
-            logging.info("Project {} has {} Jobs".format(self.project_name, len(job_list)))
+            logging.info("Project %s has %s Jobs", self.project_name, len(job_list))
         job_metadata_list = []
         for job in job_list:
-            job_info_flatten = flatten_json_data(job)
+            job_info_flatten = FlattenedView(job)
             job_metadata = extract_fields(job_info_flatten, constants.JOB_MAP)
             job_name_list.append(job_metadata["name"])
             job_metadata_list.append(job_metadata)
-        return job_metadata_list, sorted(job_name_list)
+        job_name_list.sort()
+        return job_metadata_list, job_name_list
 
     def collect_export_model_list(self, proj_id):
         model_list = self.get_models_listv1(proj_id)
@@ -765,14 +793,15 @@ class ProjectExporter(BaseWorkspaceInteractor):
         if len(model_list) == 0:
             logging.info("Models are not present in the project %s.", self.project_name)
         else:
-            logging.info("Project {} has {} Models".format(self.project_name, len(model_list)))
+            logging.info("Project %s has %s Models", self.project_name, len(model_list))
         model_metadata_list = []
         for model in model_list:
-            model_info_flatten = flatten_json_data(model)
+            model_info_flatten = FlattenedView(model)
             model_metadata = extract_fields(model_info_flatten, constants.MODEL_MAP)
             model_name_list.append(model_metadata["name"])
             model_metadata_list.append(model_metadata)
-        return model_metadata_list, sorted(model_name_list)
+        model_name_list.sort()
+        return model_metadata_list, model_name_list
 
     def collect_export_application_list(self):
         app_list = self.get_app_listv1()
@@ -782,17 +811,19 @@ class ProjectExporter(BaseWorkspaceInteractor):
                 "Applications are not present in the project %s.", self.project_name
             )
         else:
-            logging.info("Project {} has {} Applications".format(self.project_name, len(app_list)))
+            logging.info(
+                "Project %s has %s Applications", self.project_name, len(app_list)
+            )
         app_metadata_list = []
         for app in app_list:
-            app_info_flatten = flatten_json_data(app)
+            app_info_flatten = FlattenedView(app)
             app_metadata = extract_fields(app_info_flatten, constants.APPLICATION_MAP)
             app_name_list.append(app_metadata["name"])
-            project_env = self.get_project_env()
             if not app_metadata.get("environment"):
-                app_metadata["environment"] = project_env
+                app_metadata["environment"] = self._project_env
             app_metadata_list.append(app_metadata)
-        return app_metadata_list, sorted(app_name_list)
+        app_name_list.sort()
+        return app_metadata_list, app_name_list
 
     def _export_job_metadata(self):
         filepath = get_jobs_metadata_file_path(
@@ -802,30 +833,32 @@ class ProjectExporter(BaseWorkspaceInteractor):
         job_list = self.get_jobs_listv1()
         if len(job_list) == 0:
             logging.info("Jobs are not present in the project %s.", self.project_name)
-        runtime_list = self.get_all_runtimes()
+        runtime_by_id = self._runtime_by_id
+        engine_map = legacy_engine_runtime_constants.engine_to_runtime_map()
+        default_runtime = engine_map.get("default")
         job_metadata_list = []
         job_name_list = []
 
-        for job_item in job_list:
-            job = self.get_job_infov1(job_item["id"])
-            job_info_flatten = flatten_json_data(job)
+        jobs = run_concurrently(
+            lambda job_item: self.get_job_infov1(job_item["id"]), job_list
+        )
+
+        for job in jobs:
+            job_info_flatten = FlattenedView(job)
             job_metadata = extract_fields(job_info_flatten, constants.JOB_MAP)
             job_name_list.append(job_metadata["name"])
-            job_metadata["attachments"] = job.get("report", []).get("attachments", [])
+            job_metadata["attachments"] = (job.get("report") or {}).get(
+                "attachments", []
+            )
             job_metadata["environment"] = job.get("environment", {})
             if "runtime.id" in job_info_flatten:
-                runtime_obj = find_runtime(
-                    runtime_list=runtime_list["runtimes"],
-                    runtime_id=job_info_flatten["runtime.id"],
+                runtime_obj = find_runtime_by_id(
+                    runtime_by_id, job_info_flatten["runtime.id"]
                 )
                 if runtime_obj != None:
                     job_metadata.update(runtime_obj)
                 else:
-                    job_metadata[
-                        "runtime_identifier"
-                    ] = legacy_engine_runtime_constants.engine_to_runtime_map().get(
-                        "default"
-                    )
+                    job_metadata["runtime_identifier"] = default_runtime
             else:
                 if (
                     job_info_flatten["project.default_project_engine_type"]
@@ -834,42 +867,27 @@ class ProjectExporter(BaseWorkspaceInteractor):
                     # We are expecting LEGACY_ENGINE_MAP if the user want to migrate from an engine to runtime,
                     # and the mapping should be given in LEGACY_ENGINE_MAP
                     # If the mapping is not given, the workloads will be created with the default engine images.
-                    if bool(legacy_engine_runtime_constants.engine_to_runtime_map()):
-                        if job_info_flatten["kernel"] != "":
-                            runtime_identifier = legacy_engine_runtime_constants.engine_to_runtime_map().get(
-                                job_info_flatten["kernel"],
-                                legacy_engine_runtime_constants.engine_to_runtime_map().get(
-                                    "default"
-                                ),
-                            )
+                    kernel = job_info_flatten["kernel"]
+                    if bool(engine_map):
+                        if kernel != "":
+                            runtime_identifier = engine_map.get(kernel, default_runtime)
                             job_metadata["runtime_identifier"] = runtime_identifier
                         else:
-                            job_metadata[
-                                "runtime_identifier"
-                            ] = legacy_engine_runtime_constants.engine_to_runtime_map().get(
-                                "default"
-                            )
+                            job_metadata["runtime_identifier"] = default_runtime
                     else:
-                        if job_info_flatten["kernel"] != "":
-                            job_metadata["kernel"] = job_info_flatten["kernel"]
+                        if kernel != "":
+                            job_metadata["kernel"] = kernel
                         else:
-                            job_metadata[
-                                "runtime_identifier"
-                            ] = legacy_engine_runtime_constants.engine_to_runtime_map().get(
-                                "default"
-                            )
+                            job_metadata["runtime_identifier"] = default_runtime
                 else:
-                    job_metadata[
-                        "runtime_identifier"
-                    ] = legacy_engine_runtime_constants.engine_to_runtime_map().get(
-                        "default"
-                    )
+                    job_metadata["runtime_identifier"] = default_runtime
 
             job_metadata_list.append(job_metadata)
 
         write_json_file(file_path=filepath, json_data=job_metadata_list)
         self.metrics_data["total_job"] = len(job_name_list)
-        self.metrics_data["job_name_list"] = sorted(job_name_list)
+        job_name_list.sort()
+        self.metrics_data["job_name_list"] = job_name_list
 
     def dump_project_and_related_metadata(self):
         self._export_project_metadata()
@@ -880,17 +898,23 @@ class ProjectExporter(BaseWorkspaceInteractor):
 
     def collect_export_project_data(self):
         proj_data_raw = self.get_project_infov1()
-        proj_info_flatten = flatten_json_data(proj_data_raw)
+        proj_info_flatten = FlattenedView(proj_data_raw)
         proj_data = [extract_fields(proj_info_flatten, constants.PROJECT_MAP)]
         proj_list = [self.project_name.lower()]
         if not proj_data[0].get("shared_memory_limit"):
             proj_data[0]["shared_memory_limit"] = 0
 
-        model_data, model_list = self.collect_export_model_list(
-            int(proj_data_raw["id"])
+        # The three collections are independent reads, so fetch them together.
+        (model_data, model_list), (app_data, app_list), (job_data, job_list) = (
+            run_concurrently(
+                lambda collect: collect(),
+                [
+                    partial(self.collect_export_model_list, int(proj_data_raw["id"])),
+                    self.collect_export_application_list,
+                    self.collect_export_job_list,
+                ],
+            )
         )
-        app_data, app_list = self.collect_export_application_list()
-        job_data, job_list = self.collect_export_job_list()
         return (
             proj_data,
             proj_list,
@@ -915,31 +939,28 @@ class ProjectImporter(BaseWorkspaceInteractor):
         project_slug: str,
     ) -> None:
         self._ssh_subprocess = None
+        self._ssh_port = None
         self.top_level_dir = top_level_dir
         super().__init__(host, username, project_name, api_key, ca_path, project_slug)
         self.metrics_data = dict()
+        self._import_lists = dict()
 
     def get_creator_username(self):
         next_page_exists = True
         offset = 0
-        project_list = []
+        previous_page = None
 
         # Handle Pagination if exists
         while next_page_exists:
             # Note - projectName param makes LIKE query not the exact match
-            endpoint = Template(ApiV1Endpoints.PROJECTS_SUMMARY.value).substitute(
+            endpoint = _API_V1_TEMPLATES[ApiV1Endpoints.PROJECTS_SUMMARY].substitute(
                 username=self.username,
                 projectName=self.project_name,
                 limit=constants.MAX_API_PAGE_LENGTH,
                 offset=offset * constants.MAX_API_PAGE_LENGTH,
             )
-            response = call_api_v1(
-                host=self.host,
-                endpoint=endpoint,
-                method="GET",
-                api_key=self.api_key,
-                ca_path=self.ca_path,
-            )
+            response = self._call_v1(endpoint=endpoint, method="GET")
+            page = parse_json_response(response)
 
             """
             End loop           
@@ -949,27 +970,24 @@ class ProjectImporter(BaseWorkspaceInteractor):
             b. If length of response is greater than MAX_API_PAGE_LENGTH => If source is CDSW, as CDSW doesn't honor limit
             c. If CDSW non-paginated response length is exactly the MAX_API_PAGE_LENGTH
             """
-            if len(response.json()) != constants.MAX_API_PAGE_LENGTH:
-                next_page_exists = False
-            else:
-                # Handling if CDSW non-paginated response length is MAX_API_PAGE_LENGTH
-                if project_list == response.json():
-                    break
-
-            project_list = project_list + response.json()
-            offset = offset + 1
+            # Handling if CDSW non-paginated response length is MAX_API_PAGE_LENGTH
+            if page == previous_page:
+                break
 
-        if project_list:
-            for project in project_list:
+            for project in page:
                 if project["name"] == self.project_name:
                     return project["creator"]["username"], project["slug_raw"]
+
+            if len(page) != constants.MAX_API_PAGE_LENGTH:
+                next_page_exists = False
+            previous_page = page
+            offset = offset + 1
+
         return None
 
     def transfer_project(self, log_filedir: str, verify=False):
         result = None
-        rsync_enabled_runtime_id = get_rsync_enabled_runtime_id(
-            host=self.host, api_key=self.apiv2_key, ca_path=self.ca_path
-        )
+        rsync_enabled_runtime_id = self._rsync_runtime_id
         cdswctl_path = obtain_cdswctl(host=self.host, ca_path=self.ca_path)
         login_response = cdswctl_login(
             cdswctl_path=cdswctl_path,
@@ -987,6 +1005,7 @@ class ProjectImporter(BaseWorkspaceInteractor):
             project_slug=self.project_slug,
         )
         self._ssh_subprocess = ssh_subprocess
+        self._ssh_port = port
         transfer_project_files(
             sshport=port,
             source=os.path.join(
@@ -1001,6 +1020,8 @@ class ProjectImporter(BaseWorkspaceInteractor):
             log_filedir=log_filedir,
         )
         if verify:
+            # Right after a transfer sizes and modification times always match,
+            # so only a checksum comparison can find a file that differs.
             result = verify_files(
                 sshport=port,
                 source=os.path.join(
@@ -1013,14 +1034,13 @@ class ProjectImporter(BaseWorkspaceInteractor):
                 retry_limit=3,
                 project_name=self.project_name,
                 log_filedir=log_filedir,
+                use_checksum=True,
             )
         self.remove_cdswctl_dir(cdswctl_path)
         return result
 
-    def verify_project(self, log_filedir: str):
-        rsync_enabled_runtime_id = get_rsync_enabled_runtime_id(
-            host=self.host, api_key=self.apiv2_key, ca_path=self.ca_path
-        )
+    def verify_project(self, log_filedir: str, use_checksum: bool = False):
+        rsync_enabled_runtime_id = self._rsync_runtime_id
         cdswctl_path = obtain_cdswctl(host=self.host, ca_path=self.ca_path)
         login_response = cdswctl_login(
             cdswctl_path=cdswctl_path,
@@ -1038,6 +1058,7 @@ class ProjectImporter(BaseWorkspaceInteractor):
             project_slug=self.project_slug,
         )
         self._ssh_subprocess = ssh_subprocess
+        self._ssh_port = port
         result = verify_files(
             sshport=port,
             source=os.path.join(
@@ -1050,195 +1071,144 @@ class ProjectImporter(BaseWorkspaceInteractor):
             retry_limit=3,
             project_name=self.project_name,
             log_filedir=log_filedir,
+            use_checksum=use_checksum,
         )
         self.remove_cdswctl_dir(cdswctl_path)
         return result
 
+    # Shared by transfer_project and verify_project.
+    @cached_property
+    def _rsync_runtime_id(self) -> int:
+        return get_rsync_enabled_runtime_id(
+            host=self.host, api_key=self.apiv2_key, ca_path=self.ca_path
+        )
+
     def terminate_ssh_session(self):
         logging.info("Terminating ssh connection.")
+        if self._ssh_port is not None:
+            close_ssh_master(self._ssh_port)
         if self._ssh_subprocess is not None:
-            self._ssh_subprocess.send_signal(signal.SIGINT)
+            stop_ssh_endpoint(self._ssh_subprocess)
         self._ssh_subprocess = None
+        self._ssh_port = None
 
-    def create_project_v2(self, proj_metadata) -> str:
+    def _post_and_get_id(self, endpoint: str, json_data) -> str:
         try:
-            endpoint = ApiV2Endpoints.PROJECTS.value
-            response = call_api_v2(
-                host=self.host,
-                endpoint=endpoint,
-                method="POST",
-                user_token=self.apiv2_key,
-                json_data=proj_metadata,
-                ca_path=self.ca_path,
+            response = self._call_v2(
+                endpoint=endpoint, method="POST", json_data=json_data
             )
-            json_resp = response.json()
+            json_resp = parse_json_response(response)
             return json_resp["id"]
         except KeyError as e:
-            logging.error(f"Error: {e}")
+            logging.error("Error: %s", e)
             raise
 
+    def create_project_v2(self, proj_metadata) -> str:
+        return self._post_and_get_id(ApiV2Endpoints.PROJECTS.value, proj_metadata)
+
     def convert_project_to_engine_based(self, proj_patch_metadata) -> bool:
         try:
-            endpoint2 = Template(ApiV1Endpoints.PROJECT.value).substitute(
+            endpoint2 = _API_V1_TEMPLATES[ApiV1Endpoints.PROJECT].substitute(
                 username=self.username, project_name=self.project_name
             )
-            response = call_api_v1(
-                host=self.host,
-                endpoint=endpoint2,
-                method="PATCH",
-                api_key=self.api_key,
-                json_data=proj_patch_metadata,
-                ca_path=self.ca_path,
+            response = self._call_v1(
+                endpoint=endpoint2, method="PATCH", json_data=proj_patch_metadata
             )
             return True
         except KeyError as e:
-            logging.error(f"Error: {e}")
+            logging.error("Error: %s", e)
             raise
 
     def create_model_v2(self, proj_id: str, model_metadata) -> str:
-        try:
-            endpoint = Template(ApiV2Endpoints.CREATE_MODEL.value).substitute(
-                project_id=proj_id
-            )
-            response = call_api_v2(
-                host=self.host,
-                endpoint=endpoint,
-                method="POST",
-                user_token=self.apiv2_key,
-                json_data=model_metadata,
-                ca_path=self.ca_path,
-            )
-            json_resp = response.json()
-            return json_resp["id"]
-        except KeyError as e:
-            logging.error(f"Error: {e}")
-            raise
+        endpoint = _API_V2_TEMPLATES[ApiV2Endpoints.CREATE_MODEL].substitute(
+            project_id=proj_id
+        )
+        return self._post_and_get_id(endpoint, model_metadata)
 
     def create_model_build_v2(
         self, proj_id: str, model_id: str, model_metadata
     ) -> None:
-        endpoint = Template(ApiV2Endpoints.BUILD_MODEL.value).substitute(
+        endpoint = _API_V2_TEMPLATES[ApiV2Endpoints.BUILD_MODEL].substitute(
             project_id=proj_id, model_id=model_id
         )
-        response = call_api_v2(
-            host=self.host,
-            endpoint=endpoint,
-            method="POST",
-            user_token=self.apiv2_key,
-            json_data=model_metadata,
-            ca_path=self.ca_path,
+        response = self._call_v2(
+            endpoint=endpoint, method="POST", json_data=model_metadata
         )
         return
 
     def create_application_v2(self, proj_id: str, app_metadata) -> str:
-        try:
-            endpoint = Template(ApiV2Endpoints.CREATE_APP.value).substitute(
-                project_id=proj_id
-            )
-            response = call_api_v2(
-                host=self.host,
-                endpoint=endpoint,
-                method="POST",
-                user_token=self.apiv2_key,
-                json_data=app_metadata,
-                ca_path=self.ca_path,
-            )
-            json_resp = response.json()
-            return json_resp["id"]
-        except KeyError as e:
-            logging.error(f"Error: {e}")
-            raise
+        endpoint = _API_V2_TEMPLATES[ApiV2Endpoints.CREATE_APP].substitute(
+            project_id=proj_id
+        )
+        return self._post_and_get_id(endpoint, app_metadata)
 
     def stop_application_v2(self, proj_id: str, app_id: str) -> None:
-        endpoint = Template(ApiV2Endpoints.STOP_APP.value).substitute(
+        endpoint = _API_V2_TEMPLATES[ApiV2Endpoints.STOP_APP].substitute(
             project_id=proj_id, application_id=app_id
         )
-        response = call_api_v2(
-            host=self.host,
-            endpoint=endpoint,
-            method="POST",
-            user_token=self.apiv2_key,
-            ca_path=self.ca_path,
-        )
+        response = self._call_v2(endpoint=endpoint, method="POST")
         return
 
     def create_job_v2(self, proj_id: str, job_metadata) -> str:
-        try:
-            endpoint = Template(ApiV2Endpoints.CREATE_JOB.value).substitute(
-                project_id=proj_id
-            )
-            response = call_api_v2(
-                host=self.host,
-                endpoint=endpoint,
-                method="POST",
-                user_token=self.apiv2_key,
-                json_data=job_metadata,
-                ca_path=self.ca_path,
-            )
-            json_resp = response.json()
-            return json_resp["id"]
-        except KeyError as e:
-            logging.error(f"Error: {e}")
-            raise
+        endpoint = _API_V2_TEMPLATES[ApiV2Endpoints.CREATE_JOB].substitute(
+            project_id=proj_id
+        )
+        return self._post_and_get_id(endpoint, job_metadata)
 
     def update_job_v2(self, proj_id: str, job_id: str, job_metadata) -> None:
-        endpoint = Template(ApiV2Endpoints.UPDATE_JOB.value).substitute(
+        endpoint = _API_V2_TEMPLATES[ApiV2Endpoints.UPDATE_JOB].substitute(
             project_id=proj_id, job_id=job_id
         )
-        response = call_api_v2(
-            host=self.host,
-            endpoint=endpoint,
-            method="PATCH",
-            user_token=self.apiv2_key,
-            json_data=job_metadata,
-            ca_path=self.ca_path,
+        response = self._call_v2(
+            endpoint=endpoint, method="PATCH", json_data=job_metadata
         )
         return
 
     # Get all runtimes using API v1
     def get_all_runtimes(self):
         endpoint = ApiV1Endpoints.RUNTIMES.value
-        response = call_api_v1(
+        response = self._call_v1(endpoint=endpoint, method="GET")
+        return parse_json_response(response)
+
+    # Runtime lookups below are fetched once and reused by every create_* call.
+    @cached_property
+    def _runtime_list(self):
+        return self.get_all_runtimes()
+
+    @cached_property
+    def _runtime_index(self):
+        return build_runtime_index(self._runtime_list["runtimes"])
+
+    @cached_property
+    def _spark_runtime_id(self):
+        return self.get_spark_runtimeaddons()
+
+    @cached_property
+    def _proj_with_runtime(self) -> bool:
+        return is_project_configured_with_runtimes(
             host=self.host,
-            endpoint=endpoint,
-            method="GET",
+            username=self.username,
+            project_name=self.project_name,
             api_key=self.api_key,
             ca_path=self.ca_path,
+            project_slug=self.project_slug,
         )
-        return response.json()
 
     # Get spark runtime addons using API v2
     def get_spark_runtimeaddons(self):
-        search_option = {"identifier": constants.SPARK_ADDON, "status": "AVAILABLE"}
-        encoded_option = urllib.parse.quote(json.dumps(search_option).replace('"', '"'))
-        endpoint = Template(ApiV2Endpoints.RUNTIME_ADDONS.value).substitute(
-            search_option=encoded_option
-        )
-        response = call_api_v2(
-            host=self.host,
-            endpoint=endpoint,
-            method="GET",
-            user_token=self.apiv2_key,
-            ca_path=self.ca_path,
-        )
-        result_list = response.json()["runtime_addons"]
+        response = self._call_v2(endpoint=_SPARK_ADDON_ENDPOINT, method="GET")
+        result_list = parse_json_response(response)["runtime_addons"]
         if result_list:
             return result_list[0]["identifier"]
         return None
 
     def get_all_runtimes_v2(self, page_token=""):
-        endpoint = Template(ApiV2Endpoints.RUNTIMES.value).substitute(
+        endpoint = _API_V2_TEMPLATES[ApiV2Endpoints.RUNTIMES].substitute(
             page_size=constants.MAX_API_PAGE_LENGTH, page_token=page_token
         )
 
-        response = call_api_v2(
-            host=self.host,
-            endpoint=endpoint,
-            method="GET",
-            user_token=self.apiv2_key,
-            ca_path=self.ca_path,
-        )
-        result_list = response.json()
+        response = self._call_v2(endpoint=endpoint, method="GET")
+        result_list = parse_json_response(response)
         if result_list:
             return result_list
         return None
@@ -1246,158 +1216,68 @@ class ProjectImporter(BaseWorkspaceInteractor):
     def check_project_exist(self, project_name: str) -> str:
         try:
             search_option = {"name": project_name}
-            encoded_option = urllib.parse.quote(
-                json.dumps(search_option).replace('"', '"')
-            )
-            endpoint = Template(ApiV2Endpoints.SEARCH_PROJECT.value).substitute(
+            encoded_option = _encode_search_option(search_option)
+            endpoint = _API_V2_TEMPLATES[ApiV2Endpoints.SEARCH_PROJECT].substitute(
                 search_option=encoded_option
             )
-            response = call_api_v2(
-                host=self.host,
-                endpoint=endpoint,
-                method="GET",
-                user_token=self.apiv2_key,
-                ca_path=self.ca_path,
-            )
-            project_list = response.json()["projects"]
-            if project_list:
-                for project in project_list:
-                    if project["name"] == project_name:
-                        return project["id"]
-            return None
-        except KeyError as e:
-            logging.error(f"Error: {e}")
-            raise
-
-    def check_model_exist(self, model_name: str, proj_id: str) -> bool:
-        try:
-            search_option = {"name": model_name}
-            encoded_option = urllib.parse.quote(
-                json.dumps(search_option).replace('"', '"')
-            )
-            endpoint = Template(ApiV2Endpoints.SEARCH_MODEL.value).substitute(
-                project_id=proj_id, search_option=encoded_option
-            )
-            response = call_api_v2(
-                host=self.host,
-                endpoint=endpoint,
-                method="GET",
-                user_token=self.apiv2_key,
-                ca_path=self.ca_path,
-            )
-            model_list = response.json()["models"]
-            if model_list:
-                for model in model_list:
-                    if model["name"] == model_name:
-                        return True
-            return False
-        except KeyError as e:
-            logging.error(f"Error: {e}")
-            raise
-
-    def check_job_exist(self, job_name: str, script: str, proj_id: str) -> str:
-        try:
-            search_option = {"name": job_name, "script": script}
-            encoded_option = urllib.parse.quote(
-                json.dumps(search_option).replace('"', '"')
-            )
-            endpoint = Template(ApiV2Endpoints.SEARCH_JOB.value).substitute(
-                project_id=proj_id, search_option=encoded_option
-            )
-            response = call_api_v2(
-                host=self.host,
-                endpoint=endpoint,
-                method="GET",
-                user_token=self.apiv2_key,
-                ca_path=self.ca_path,
+            response = self._call_v2(endpoint=endpoint, method="GET")
+            project_list = parse_json_response(response)["projects"] or []
+            return next(
+                (
+                    project["id"]
+                    for project in project_list
+                    if project["name"] == project_name
+                ),
+                None,
             )
-            job_list = response.json()["jobs"]
-            if job_list:
-                for job in job_list:
-                    if job["name"] == job_name and job["script"] == script:
-                        return job["id"]
-            return None
         except KeyError as e:
-            logging.error(f"Error: {e}")
+            logging.error("Error: %s", e)
             raise
 
-    def check_app_exist(self, subdomain: str, proj_id: str) -> bool:
-        try:
-            search_option = {"subdomain": subdomain}
-            encoded_option = urllib.parse.quote(
-                json.dumps(search_option).replace('"', '"')
-            )
-            endpoint = Template(ApiV2Endpoints.SEARCH_APP.value).substitute(
-                project_id=proj_id, search_option=encoded_option
+    def _list_all_v2(self, endpoint: ApiV2Endpoints, result_key: str, proj_id: str):
+        # Page through the listing so that a single call set covers every item.
+        items = []
+        page_token = ""
+        while True:
+            endpoint_url = _API_V2_TEMPLATES[endpoint].substitute(
+                project_id=proj_id,
+                page_size=constants.MAX_API_V2_PAGE_SIZE,
+                page_token=urllib.parse.quote(page_token, safe=""),
             )
-            response = call_api_v2(
-                host=self.host,
-                endpoint=endpoint,
-                method="GET",
-                user_token=self.apiv2_key,
-                ca_path=self.ca_path,
-            )
-            app_list = response.json()["applications"]
-            if app_list:
-                for app in app_list:
-                    if app["subdomain"] == subdomain:
-                        return True
-            return False
-        except KeyError as e:
-            logging.error(f"Error: {e}")
-            raise
+            response = self._call_v2(endpoint=endpoint_url, method="GET")
+            json_resp = parse_json_response(response)
+            items.extend(json_resp[result_key])
+            page_token = json_resp.get("next_page_token", "")
+            if not page_token:
+                return items
 
     def get_models_listv2(self, proj_id: str):
-        endpoint = Template(ApiV2Endpoints.MODELS_LIST.value).substitute(
-            project_id=proj_id
-        )
-        response = call_api_v2(
-            host=self.host,
-            endpoint=endpoint,
-            method="GET",
-            user_token=self.apiv2_key,
-            ca_path=self.ca_path,
-        )
-        return response.json()
+        return {
+            "models": self._list_all_v2(
+                ApiV2Endpoints.MODELS_PAGE, result_key="models", proj_id=proj_id
+            )
+        }
 
     def get_models_detailv2(self, proj_id: str, model_id: str):
-        endpoint = Template(ApiV2Endpoints.BUILD_MODEL.value).substitute(
+        endpoint = _API_V2_TEMPLATES[ApiV2Endpoints.BUILD_MODEL].substitute(
             project_id=proj_id, model_id=model_id
         )
-        response = call_api_v2(
-            host=self.host,
-            endpoint=endpoint,
-            method="GET",
-            user_token=self.apiv2_key,
-            ca_path=self.ca_path,
-        )
-        return response.json()
+        response = self._call_v2(endpoint=endpoint, method="GET")
+        return parse_json_response(response)
 
     def get_jobs_listv2(self, proj_id: str):
-        endpoint = Template(ApiV2Endpoints.JOBS_LIST.value).substitute(
-            project_id=proj_id
-        )
-        response = call_api_v2(
-            host=self.host,
-            endpoint=endpoint,
-            method="GET",
-            user_token=self.apiv2_key,
-            ca_path=self.ca_path,
-        )
-        return response.json()
+        return {
+            "jobs": self._list_all_v2(
+                ApiV2Endpoints.JOBS_PAGE, result_key="jobs", proj_id=proj_id
+            )
+        }
 
     def get_application_listv2(self, proj_id: str):
-        endpoint = Template(ApiV2Endpoints.APPS_LIST.value).substitute(
-            project_id=proj_id
-        )
-        response = call_api_v2(
-            host=self.host,
-            endpoint=endpoint,
-            method="GET",
-            user_token=self.apiv2_key,
-            ca_path=self.ca_path,
-        )
-        return response.json()
+        return {
+            "applications": self._list_all_v2(
+                ApiV2Endpoints.APPS_PAGE, result_key="applications", proj_id=proj_id
+            )
+        }
 
     def import_metadata(self, project_id: str):
         models_metadata_filepath = get_models_metadata_file_path(
@@ -1420,24 +1300,37 @@ class ProjectImporter(BaseWorkspaceInteractor):
         self.create_paused_jobs(
             project_id=project_id, job_metadata_filepath=job_metadata_filepath
         )
-        self.get_project_infov2(proj_id=project_id)
-        self.collect_import_model_list(project_id=project_id)
-        self.collect_import_application_list(project_id=project_id)
-        self.collect_import_job_list(project_id=project_id)
+        self._collect_import_lists(project_id)
         return self.metrics_data
 
+    def _collect_import_lists(self, project_id: str):
+        # import_metadata and collect_imported_project_data read the same lists,
+        # and nothing is created in the project between the two.
+        if project_id not in self._import_lists:
+            self._import_lists[project_id] = run_concurrently(
+                lambda collect: collect(project_id=project_id),
+                [
+                    self.collect_import_model_list,
+                    self.collect_import_application_list,
+                    self.collect_import_job_list,
+                ],
+            )
+        return self._import_lists[project_id]
+
     def collect_imported_project_data(self, project_id: str):
         proj_data_raw = self.get_project_infov2(proj_id=project_id)
-        proj_info_flatten = flatten_json_data(proj_data_raw)
+        proj_info_flatten = FlattenedView(proj_data_raw)
         proj_data = [extract_fields(proj_info_flatten, constants.PROJECT_MAPV2)]
         proj_list = [
-            self.project_name.lower()
-            if self.check_project_exist(self.project_name)
-            else None
+            (
+                self.project_name.lower()
+                if self.check_project_exist(self.project_name)
+                else None
+            )
         ]
-        model_data, model_list = self.collect_import_model_list(project_id=project_id)
-        app_data, app_list = self.collect_import_application_list(project_id=project_id)
-        job_data, job_list = self.collect_import_job_list(project_id=project_id)
+        (model_data, model_list), (app_data, app_list), (job_data, job_list) = (
+            self._collect_import_lists(project_id)
+        )
         return (
             proj_data,
             proj_list,
@@ -1449,73 +1342,94 @@ class ProjectImporter(BaseWorkspaceInteractor):
             job_list,
         )
 
+    def _migrate_model(
+        self,
+        project_id: str,
+        model_metadata,
+        runtime_index,
+        proj_with_runtime: bool,
+        existing_model_names: set,
+    ):
+        if model_metadata["name"] in existing_model_names:
+            logging.info(
+                "Skipping the already existing model- %s",
+                model_metadata["name"],
+            )
+            return
+        model_metadata["project_id"] = project_id
+        if not "runtime_identifier" in model_metadata and proj_with_runtime:
+            runtime_identifier = get_best_runtime(
+                runtime_index,
+                model_metadata["runtime_edition"],
+                model_metadata["runtime_editor"],
+                model_metadata["runtime_kernel"],
+                model_metadata["runtime_shortversion"],
+                model_metadata["runtime_fullversion"],
+            )
+            if runtime_identifier != None:
+                model_metadata["runtime_identifier"] = runtime_identifier
+            else:
+                logging.warning(
+                    "Couldn't locate runtime identifier for model %s",
+                    model_metadata["name"],
+                )
+                logging.info(
+                    "Applying default runtime %s",
+                    legacy_engine_runtime_constants.engine_to_runtime_map().get(
+                        "default"
+                    ),
+                )
+                model_metadata[
+                    "runtime_identifier"
+                ] = legacy_engine_runtime_constants.engine_to_runtime_map().get(
+                    "default"
+                )
+        model_id = self.create_model_v2(
+            proj_id=project_id, model_metadata=model_metadata
+        )
+        self.create_model_build_v2(
+            proj_id=project_id,
+            model_id=model_id,
+            model_metadata=model_metadata,
+        )
+        logging.info(
+            "Model- %s has been migrated successfully",
+            model_metadata["name"],
+        )
+
     def create_models(self, project_id: str, models_metadata_filepath: str):
         try:
-            runtime_list = self.get_all_runtimes()
-            proj_with_runtime = is_project_configured_with_runtimes(
-                host=self.host,
-                username=self.username,
-                project_name=self.project_name,
-                api_key=self.api_key,
-                ca_path=self.ca_path,
-                project_slug=self.project_slug,
-            )
+            proj_with_runtime = self._proj_with_runtime
+            # Runtimes are only matched for projects configured with runtimes.
+            runtime_index = self._runtime_index if proj_with_runtime else None
             model_metadata_list = read_json_file(models_metadata_filepath)
             if model_metadata_list != None:
-                for model_metadata in model_metadata_list:
-                    if not self.check_model_exist(
-                        model_name=model_metadata["name"], proj_id=project_id
-                    ):
-                        model_metadata["project_id"] = project_id
-                        if (
-                            not "runtime_identifier" in model_metadata
-                            and proj_with_runtime
-                        ):
-                            runtime_identifier = get_best_runtime(
-                                runtime_list["runtimes"],
-                                model_metadata["runtime_edition"],
-                                model_metadata["runtime_editor"],
-                                model_metadata["runtime_kernel"],
-                                model_metadata["runtime_shortversion"],
-                                model_metadata["runtime_fullversion"],
-                            )
-                            if runtime_identifier != None:
-                                model_metadata[
-                                    "runtime_identifier"
-                                ] = runtime_identifier
-                            else:
-                                logging.warning(
-                                    "Couldn't locate runtime identifier for model %s",
-                                    model_metadata["name"],
-                                )
-                                logging.info(
-                                    "Applying default runtime %s",
-                                    legacy_engine_runtime_constants.engine_to_runtime_map().get(
-                                        "default"
-                                    ),
-                                )
-                                model_metadata[
-                                    "runtime_identifier"
-                                ] = legacy_engine_runtime_constants.engine_to_runtime_map().get(
-                                    "default"
-                                )
-                        model_id = self.create_model_v2(
-                            proj_id=project_id, model_metadata=model_metadata
-                        )
-                        self.create_model_build_v2(
-                            proj_id=project_id,
-                            model_id=model_id,
-                            model_metadata=model_metadata,
-                        )
-                        logging.info(
-                            "Model- %s has been migrated successfully",
-                            model_metadata["name"],
-                        )
-                    else:
-                        logging.info(
-                            "Skipping the already existing model- %s",
-                            model_metadata["name"],
-                        )
+                existing_model_names = {
+                    model["name"]
+                    for model in self._list_all_v2(
+                        ApiV2Endpoints.MODELS_PAGE, "models", project_id
+                    )
+                }
+                # The existing names are a snapshot, so repeated names in the
+                # metadata are dropped here rather than created concurrently.
+                unique_models, duplicate_models, _ = _dedupe_by_key(
+                    model_metadata_list, lambda model: model["name"]
+                )
+                for model_metadata in duplicate_models:
+                    logging.info(
+                        "Skipping the already existing model- %s",
+                        model_metadata["name"],
+                    )
+                run_concurrently(
+                    lambda model_metadata: self._migrate_model(
+                        project_id,
+                        model_metadata,
+                        runtime_index,
+                        proj_with_runtime,
+                        existing_model_names,
+                    ),
+                    unique_models,
+                )
 
             return
         except FileNotFoundError as e:
@@ -1523,61 +1437,85 @@ class ProjectImporter(BaseWorkspaceInteractor):
             return
         except Exception as e:
             logging.error("Model migration failed")
-            logging.error(f"Error: {e}")
+            logging.error("Error: %s", e)
             raise
 
+    def _migrate_application(
+        self,
+        project_id: str,
+        app_metadata,
+        runtime_index,
+        proj_with_runtime: bool,
+        existing_subdomains: set,
+    ):
+        if app_metadata["subdomain"] in existing_subdomains:
+            logging.info(
+                "Skipping the already existing application %s with same subdomain- %s",
+                app_metadata["name"],
+                app_metadata["subdomain"],
+            )
+            return
+        app_metadata["project_id"] = project_id
+        if not "runtime_identifier" in app_metadata and proj_with_runtime:
+            runtime_identifier = get_best_runtime(
+                runtime_index,
+                app_metadata["runtime_edition"],
+                app_metadata["runtime_editor"],
+                app_metadata["runtime_kernel"],
+                app_metadata["runtime_shortversion"],
+                app_metadata["runtime_fullversion"],
+            )
+            if runtime_identifier != None:
+                app_metadata["runtime_identifier"] = runtime_identifier
+            else:
+                app_metadata[
+                    "runtime_identifier"
+                ] = legacy_engine_runtime_constants.engine_to_runtime_map().get(
+                    "default"
+                )
+        app_id = self.create_application_v2(
+            proj_id=project_id, app_metadata=app_metadata
+        )
+        self.stop_application_v2(proj_id=project_id, app_id=app_id)
+        logging.info(
+            "Application- %s has been migrated successfully",
+            app_metadata["name"],
+        )
+
     def create_stoppped_applications(self, project_id: str, app_metadata_filepath: str):
         try:
-            runtime_list = self.get_all_runtimes()
-            proj_with_runtime = is_project_configured_with_runtimes(
-                host=self.host,
-                username=self.username,
-                project_name=self.project_name,
-                api_key=self.api_key,
-                ca_path=self.ca_path,
-                project_slug=self.project_slug,
-            )
+            proj_with_runtime = self._proj_with_runtime
+            # Runtimes are only matched for projects configured with runtimes.
+            runtime_index = self._runtime_index if proj_with_runtime else None
             app_metadata_list = read_json_file(app_metadata_filepath)
             if app_metadata_list != None:
-                for app_metadata in app_metadata_list:
-                    if not self.check_app_exist(
-                        subdomain=app_metadata["subdomain"], proj_id=project_id
-                    ):
-                        app_metadata["project_id"] = project_id
-                        if (
-                            not "runtime_identifier" in app_metadata
-                            and proj_with_runtime
-                        ):
-                            runtime_identifier = get_best_runtime(
-                                runtime_list["runtimes"],
-                                app_metadata["runtime_edition"],
-                                app_metadata["runtime_editor"],
-                                app_metadata["runtime_kernel"],
-                                app_metadata["runtime_shortversion"],
-                                app_metadata["runtime_fullversion"],
-                            )
-                            if runtime_identifier != None:
-                                app_metadata["runtime_identifier"] = runtime_identifier
-                            else:
-                                app_metadata[
-                                    "runtime_identifier"
-                                ] = legacy_engine_runtime_constants.engine_to_runtime_map().get(
-                                    "default"
-                                )
-                        app_id = self.create_application_v2(
-                            proj_id=project_id, app_metadata=app_metadata
-                        )
-                        self.stop_application_v2(proj_id=project_id, app_id=app_id)
-                        logging.info(
-                            "Application- %s has been migrated successfully",
-                            app_metadata["name"],
-                        )
-                    else:
-                        logging.info(
-                            "Skipping the already existing application %s with same subdomain- %s",
-                            app_metadata["name"],
-                            app_metadata["subdomain"],
-                        )
+                existing_subdomains = {
+                    app["subdomain"]
+                    for app in self._list_all_v2(
+                        ApiV2Endpoints.APPS_PAGE, "applications", project_id
+                    )
+                }
+                # The existing subdomains are a snapshot, so repeated subdomains
+                # in the metadata are dropped here rather than created concurrently.
+                unique_apps, duplicate_apps, _ = _dedupe_by_key(
+                    app_metadata_list, lambda app: app["subdomain"]
+                )
+                for app_metadata in duplicate_apps:
+                    logging.info(
+                        "Skipping the already existing application %s with same subdomain- %s",
+                        app_metadata["name"],
+                        app_metadata["subdomain"],
+                    )
+                run_concurrently(
+                    lambda app_metadata: self._migrate_application(
+                        project_id,
+                        app_metadata,
+                        runtime_index,
+                        proj_with_runtime,
+                        existing_subdomains,
+                    ),
+                    unique_apps,
+                )
 
             return
         except FileNotFoundError as e:
@@ -1585,86 +1523,119 @@ class ProjectImporter(BaseWorkspaceInteractor):
             return
         except Exception as e:
             logging.error("Application migration failed")
-            logging.error(f"Error: {e}")
+            logging.error("Error: %s", e)
             raise
 
+    def _migrate_job(
+        self,
+        project_id: str,
+        job_metadata,
+        runtime_index,
+        spark_runtime_id,
+        proj_with_runtime: bool,
+        existing_job_ids: dict,
+    ) -> str:
+        target_job_id = existing_job_ids.get(
+            (job_metadata["name"], job_metadata["script"])
+        )
+        if target_job_id != None:
+            logging.info(
+                "Skipping the already existing job- %s",
+                job_metadata["name"],
+            )
+            return target_job_id
+        job_metadata["project_id"] = project_id
+        job_metadata["paused"] = True
+        if spark_runtime_id != None:
+            job_metadata["runtime_addon_identifiers"] = [spark_runtime_id]
+        if not "runtime_identifier" in job_metadata and proj_with_runtime:
+            runtime_identifier = get_best_runtime(
+                runtime_index,
+                job_metadata["runtime_edition"],
+                job_metadata["runtime_editor"],
+                job_metadata["runtime_kernel"],
+                job_metadata["runtime_shortversion"],
+                job_metadata["runtime_fullversion"],
+            )
+            if runtime_identifier != None:
+                job_metadata["runtime_identifier"] = runtime_identifier
+            else:
+                job_metadata[
+                    "runtime_identifier"
+                ] = legacy_engine_runtime_constants.engine_to_runtime_map().get(
+                    "default"
+                )
+        target_job_id = self.create_job_v2(
+            proj_id=project_id, job_metadata=job_metadata
+        )
+        logging.info(
+            "Job- %s has been migrated successfully",
+            job_metadata["name"],
+        )
+        return target_job_id
+
     def create_paused_jobs(self, project_id: str, job_metadata_filepath: str):
         try:
-            runtime_list = self.get_all_runtimes()
-            spark_runtime_id = self.get_spark_runtimeaddons()
-            proj_with_runtime = is_project_configured_with_runtimes(
-                host=self.host,
-                username=self.username,
-                project_name=self.project_name,
-                api_key=self.api_key,
-                ca_path=self.ca_path,
-                project_slug=self.project_slug,
-            )
+            proj_with_runtime = self._proj_with_runtime
+            # Runtimes are only matched for projects configured with runtimes.
+            runtime_index = self._runtime_index if proj_with_runtime else None
             job_metadata_list = read_json_file(job_metadata_filepath)
-            src_tgt_job_mapping = {}
+            spark_runtime_id = self._spark_runtime_id if job_metadata_list else None
             # Create job in target CML workspace.
             if job_metadata_list != None:
-                for job_metadata in job_metadata_list:
-                    target_job_id = self.check_job_exist(
-                        job_name=job_metadata["name"],
-                        script=job_metadata["script"],
-                        proj_id=project_id,
+                existing_job_ids = {}
+                for job in self._list_all_v2(
+                    ApiV2Endpoints.JOBS_PAGE, "jobs", project_id
+                ):
+                    existing_job_ids.setdefault((job["name"], job["script"]), job["id"])
+                # The existing jobs are a snapshot, so a repeated (name, script)
+                # in the metadata is created once and the repeats map to its id.
+                unique_jobs, duplicate_jobs, positions = _dedupe_by_key(
+                    job_metadata_list, lambda job: (job["name"], job["script"])
+                )
+                for job_metadata in duplicate_jobs:
+                    logging.info(
+                        "Skipping the already existing job- %s",
+                        job_metadata["name"],
                     )
-                    if target_job_id == None:
-                        job_metadata["project_id"] = project_id
-                        job_metadata["paused"] = True
-                        if spark_runtime_id != None:
-                            job_metadata["runtime_addon_identifiers"] = [
-                                spark_runtime_id
-                            ]
-                        if (
-                            not "runtime_identifier" in job_metadata
-                            and proj_with_runtime
-                        ):
-                            runtime_identifier = get_best_runtime(
-                                runtime_list["runtimes"],
-                                job_metadata["runtime_edition"],
-                                job_metadata["runtime_editor"],
-                                job_metadata["runtime_kernel"],
-                                job_metadata["runtime_shortversion"],
-                                job_metadata["runtime_fullversion"],
-                            )
-                            if runtime_identifier != None:
-                                job_metadata["runtime_identifier"] = runtime_identifier
-                            else:
-                                job_metadata[
-                                    "runtime_identifier"
-                                ] = legacy_engine_runtime_constants.engine_to_runtime_map().get(
-                                    "default"
-                                )
-                        target_job_id = self.create_job_v2(
-                            proj_id=project_id, job_metadata=job_metadata
-                        )
-                        logging.info(
-                            "Job- %s has been migrated successfully",
-                            job_metadata["name"],
-                        )
-                    else:
-                        logging.info(
-                            "Skipping the already existing job- %s",
-                            job_metadata["name"],
-                        )
-
+                unique_job_ids = run_concurrently(
+                    lambda job_metadata: self._migrate_job(
+                        project_id,
+                        job_metadata,
+                        runtime_index,
+                        spark_runtime_id,
+                        proj_with_runtime,
+                        existing_job_ids,
+                    ),
+                    unique_jobs,
+                )
+                target_job_ids = [unique_job_ids[position] for position in positions]
+                src_tgt_job_mapping = {}
+                pending_parent_updates = []
+                for job_metadata, target_job_id in zip(
+                    job_metadata_list, target_job_ids
+                ):
                     src_tgt_job_mapping[job_metadata["source_jobid"]] = target_job_id
-
-                # Update job dependency
-                for job_metadata in job_metadata_list:
                     if "parent_jobid" in job_metadata:
-                        tgt_job_id = src_tgt_job_mapping[job_metadata["source_jobid"]]
-                        tgt_parent_jobid = src_tgt_job_mapping[
-                            job_metadata["parent_jobid"]
-                        ]
-                        json_post_req = {"parent_id": tgt_parent_jobid}
-                        self.update_job_v2(
-                            proj_id=project_id,
-                            job_id=tgt_job_id,
-                            job_metadata=json_post_req,
+                        pending_parent_updates.append(
+                            (job_metadata["source_jobid"], job_metadata["parent_jobid"])
                         )
+
+                # Update job dependency, only once every job has been created.
+                run_concurrently(
+                    lambda update: self.update_job_v2(
+                        proj_id=project_id,
+                        job_id=update[0],
+                        job_metadata={"parent_id": update[1]},
+                    ),
+                    [
+                        (
+                            src_tgt_job_mapping[src_jobid],
+                            src_tgt_job_mapping[parent_jobid],
+                        )
+                        for src_jobid, parent_jobid in pending_parent_updates
+                    ],
+                )
             logging.warning("Internal job report recipients may not get migrated")
 
             return
@@ -1673,21 +1644,15 @@ class ProjectImporter(BaseWorkspaceInteractor):
             return
         except Exception as e:
             logging.error("Job migration failed")
-            logging.error(f"Error: {e}")
+            logging.error("Error: %s", e)
             raise
 
     def get_project_infov2(self, proj_id: str):
-        endpoint = Template(ApiV2Endpoints.GET_PROJECT.value).substitute(
+        endpoint = _API_V2_TEMPLATES[ApiV2Endpoints.GET_PROJECT].substitute(
             project_id=proj_id
         )
-        response = call_api_v2(
-            host=self.host,
-            endpoint=endpoint,
-            method="GET",
-            user_token=self.apiv2_key,
-            ca_path=self.ca_path,
-        )
-        return response.json()
+        response = self._call_v2(endpoint=endpoint, method="GET")
+        return parse_json_response(response)
 
     def collect_import_job_list(self, project_id):
         job_list = self.get_jobs_listv2(proj_id=project_id)["jobs"]
@@ -1695,16 +1660,17 @@ class ProjectImporter(BaseWorkspaceInteractor):
         if len(job_list) == 0:
             logging.info("Jobs are not present in the project %s.", self.project_name)
         else:
-            logging.info("Project {} has {} Jobs".format(self.project_name, len(job_list)))
+            logging.info("Project %s has %s Jobs", self.project_name, len(job_list))
         job_metadata_list = []
         for job in job_list:
-            job_info_flatten = flatten_json_data(job)
+            job_info_flatten = FlattenedView(job)
             job_metadata = extract_fields(job_info_flatten, constants.JOB_MAP)
             job_name_list.append(job_metadata["name"])
             job_metadata_list.append(job_metadata)
         self.metrics_data["total_job"] = len(job_name_list)
-        self.metrics_data["job_name_list"] = sorted(job_name_list)
-        return job_metadata_list, sorted(job_name_list)
+        job_name_list.sort()
+        self.metrics_data["job_name_list"] = job_name_list
+        return job_metadata_list, job_name_list
 
     def collect_import_model_list(self, project_id):
         model_list = self.get_models_listv2(proj_id=project_id)["models"]
@@ -1712,17 +1678,23 @@ class ProjectImporter(BaseWorkspaceInteractor):
         if len(model_list) == 0:
             logging.info("Models are not present in the project %s.", self.project_name)
         else:
-            logging.info("Project {} has {} Models".format(self.project_name, len(model_list)))
+            logging.info("Project %s has %s Models", self.project_name, len(model_list))
         model_metadata_list = []
-        model_detail_data = {}
-        for model in model_list:
-            model_info_flatten = flatten_json_data(model)
-            model_detail_data["name"] = model_info_flatten["name"]
-            model_detail_data["description"] = model_info_flatten["description"]
-            model_detail_data["disable_authentication"] = model_info_flatten["auth_enabled"] if isinstance(model_info_flatten["auth_enabled"], bool) else model_info_flatten["auth_enabled"]
-            model_details = self.get_models_detailv2(
-                proj_id=project_id, model_id=model_info_flatten["id"]
-            )
+        # Each model's builds are an independent GET, so fetch them together.
+        model_details_list = run_concurrently(
+            lambda model: self.get_models_detailv2(
+                proj_id=project_id, model_id=model["id"]
+            ),
+            model_list,
+        )
+        for model, model_details in zip(model_list, model_details_list):
+            # Only top-level fields are read here, so no flattening is needed.
+            model_name = model["name"]
+            model_detail_data = {
+                "name": model_name,
+                "description": model["description"],
+                "disable_authentication": model["auth_enabled"],
+            }
             model_metadata = {}
             if len(model_details["model_builds"]) > 0:
                 model_metadata = extract_fields(
@@ -1730,11 +1702,12 @@ class ProjectImporter(BaseWorkspaceInteractor):
                 )
                 model_detail_data.update(model_metadata)
 
-            model_name_list.append(model_info_flatten["name"])
+            model_name_list.append(model_name)
             model_metadata_list.append(model_detail_data)
         self.metrics_data["total_model"] = len(model_name_list)
-        self.metrics_data["model_name_list"] = sorted(model_name_list)
-        return model_metadata_list, sorted(model_name_list)
+        model_name_list.sort()
+        self.metrics_data["model_name_list"] = model_name_list
+        return model_metadata_list, model_name_list
 
     def collect_import_application_list(self, project_id):
         app_list = self.get_application_listv2(proj_id=project_id)["applications"]
@@ -1744,13 +1717,16 @@ class ProjectImporter(BaseWorkspaceInteractor):
                 "Applications are not present in the project %s.", self.project_name
             )
         else:
-            logging.info("Project {} has {} Application".format(self.project_name, len(app_list)))
+            logging.info(
+                "Project %s has %s Application", self.project_name, len(app_list)
+            )
         app_metadata_list = []
         for app in app_list:
-            app_info_flatten = flatten_json_data(app)
+            app_info_flatten = FlattenedView(app)
             app_metadata = extract_fields(app_info_flatten, constants.APPLICATION_MAPV2)
             app_name_list.append(app_metadata["name"])
             app_metadata_list.append(app_metadata)
         self.metrics_data["total_application"] = len(app_name_list)
-        self.metrics_data["application_name_list"] = sorted(app_name_list)
-        return app_metadata_list, sorted(app_name_list)
+        app_name_list.sort()
+        self.metrics_data["application_name_list"] = app_name_list
+        return app_metadata_list, app_name_list
@@ -8,7 +8,7 @@ class ValidationResponseStatus(Enum):
     SKIPPED = 3
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValidationResponse:
     validation_name: str
     validation_msg: str
@@ -1,8 +1,38 @@
 import logging
+import os
+import selectors
+import shutil
 import signal
 import subprocess
+import tempfile
 import time
 
+from cmlutils import constants
+
+# stderr of each running endpoint, read back by stop_ssh_endpoint.
+_stderr_files = {}
+
+
+def _read_first_line(stream, timeout: float) -> str | None:
+    # Read from the descriptor itself: select() only sees what the OS holds,
+    # and readline() would block on a line cdswctl has not finished writing.
+    # Returns None on timeout and "" if the endpoint exits without output.
+    deadline = time.monotonic() + timeout
+    fd = stream.fileno()
+    data = b""
+    with selectors.DefaultSelector() as selector:
+        selector.register(fd, selectors.EVENT_READ)
+        while b"\n" not in data:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not selector.select(timeout=remaining):
+                return None
+            chunk = os.read(fd, 4096)
+            if not chunk:
+                break
+            data += chunk
+    line, newline, _ = data.partition(b"\n")
+    return (line + newline).decode("utf-8", errors="replace")
+
 
 def open_ssh_endpoint(
     cdswctl_path: str, project_name: str, runtime_id: int, project_slug: str
@@ -20,20 +50,121 @@ def open_ssh_endpoint(
     if runtime_id != -1:
         command.append("-r")
         command.append(str(runtime_id))
+    # stderr goes to a file: nothing reads it while the endpoint runs, and a
+    # full pipe would block cdswctl.
+    stderr_file = tempfile.TemporaryFile()
     ssh_call = subprocess.Popen(
-        command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+        command, stdout=subprocess.PIPE, stderr=stderr_file, text=True
     )
+    _stderr_files[ssh_call] = stderr_file
     logging.info("Waiting for SSH connection")
-    line = ssh_call.stdout.readline()
-    if line == "" or line == None:
-        error = ssh_call.stderr.readlines()
-        logging.error(error)
+    line = _read_first_line(
+        ssh_call.stdout, constants.SSH_ENDPOINT_START_TIMEOUT_SECONDS
+    )
+    if line is None:
+        logging.error(
+            "SSH endpoint did not come up within %s seconds: %s",
+            constants.SSH_ENDPOINT_START_TIMEOUT_SECONDS,
+            stop_ssh_endpoint(ssh_call),
+        )
+        return None, -1
+    if line == "":
+        logging.error(stop_ssh_endpoint(ssh_call))
         return None, -1
     else:
         arr = line.split(" ")
         if len(arr) <= 3 or (not arr[3].isdigit()):
             logging.error("SSH connection failed unexpectedly: " + line)
-            logging.error(*ssh_call.stderr.readlines())
+            # The endpoint may still be running, so stop it before reading stderr.
+            logging.error(stop_ssh_endpoint(ssh_call))
             raise Exception("SSH connection failed unexpectedly")
         logging.info("SSH connection successfull")
-        return ssh_call, int(arr[3])
+        port = int(arr[3])
+        start_ssh_master(port)
+        return ssh_call, port
+
+
+# Private 0700 directories, one per forwarded port, that hold the master socket.
+# A socket at a shared, predictable path could be planted by another local user.
+_control_dirs = {}
+
+
+def _ssh_base_command(port: int) -> list[str]:
+    return [
+        "ssh",
+        "-p",
+        str(port),
+        "-oStrictHostKeyChecking=no",
+    ]
+
+
+def _control_path_option(control_dir: str) -> str:
+    return "-oControlPath=" + os.path.join(control_dir, "cm-%C")
+
+
+def ssh_command(port: int) -> list[str]:
+    command = _ssh_base_command(port)
+    control_dir = _control_dirs.get(port)
+    if control_dir is not None:
+        # Clients only attach to the master from start_ssh_master, so an ssh whose
+        # output is captured never becomes the long-lived master holding the pipes.
+        command += [_control_path_option(control_dir), "-oControlMaster=no"]
+    return command
+
+
+def start_ssh_master(port: int):
+    control_dir = tempfile.mkdtemp(prefix="cmlutils-ssh-")
+    result = subprocess.run(
+        _ssh_base_command(port)
+        + [
+            _control_path_option(control_dir),
+            "-oControlMaster=yes",
+            f"-oControlPersist={constants.SSH_CONTROL_PERSIST_SECONDS}",
+            "-fN",
+            constants.CDSW_ROOT_USER,
+        ],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    if result.returncode != 0:
+        shutil.rmtree(control_dir, ignore_errors=True)
+        logging.warning(
+            "Could not start a shared SSH connection. Each ssh call will connect on its own."
+        )
+        return
+    _control_dirs[port] = control_dir
+
+
+def close_ssh_master(port: int):
+    control_dir = _control_dirs.pop(port, None)
+    if control_dir is None:
+        return
+    subprocess.run(
+        _ssh_base_command(port)
+        + [_control_path_option(control_dir), "-O", "exit", constants.CDSW_ROOT_USER],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    shutil.rmtree(control_dir, ignore_errors=True)
+
+
+def stop_ssh_endpoint(ssh_call: subprocess.Popen) -> str:
+    # SIGINT lets cdswctl tear the endpoint down as it would on Ctrl-C.
+    ssh_call.send_signal(signal.SIGINT)
+    try:
+        ssh_call.communicate(timeout=constants.SSH_ENDPOINT_STOP_TIMEOUT_SECONDS)
+    except subprocess.TimeoutExpired:
+        logging.warning("SSH endpoint did not exit in time. Killing it.")
+        ssh_call.kill()
+        ssh_call.wait()
+        # A child of the endpoint may still hold the pipe open, so don't wait
+        # for EOF on it.
+        ssh_call.stdout.close()
+    stderr_file = _stderr_files.pop(ssh_call, None)
+    if stderr_file is None:
+        return ""
+    with stderr_file:
+        stderr_file.seek(0)
+        return stderr_file.read().decode("utf-8", errors="replace")
@@ -3,14 +3,80 @@ import logging
 import os
 import csv
 import shutil
+import tempfile
+import threading
 import urllib
-from encodings import utf_8
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import lru_cache
 from string import Template
 
 import requests
-from flatten_json import flatten
 from requests.adapters import HTTPAdapter, Retry
 
+from cmlutils import constants
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional. The standard library json module is used without it.
+    orjson = None
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    """Returns the process-wide session, so connections to the host are reused."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            # Only idempotent methods are retried (the Retry default), so a
+            # POST that timed out is never replayed into a duplicate create.
+            retries = Retry(
+                total=5,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                respect_retry_after_header=True,
+                # Hand the last response back once retries run out, so that
+                # raise_for_status reports it as an HTTPError like any other.
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(
+                pool_maxsize=constants.MAX_API_WORKERS, max_retries=retries
+            )
+            session = requests.Session()
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _session = session
+        return _session
+
+
+def serialize_json(json_data) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(json_data)
+    return json.dumps(json_data).encode("utf-8")
+
+
+def parse_json_response(response: requests.Response):
+    if orjson is not None:
+        return orjson.loads(response.content)
+    # json.loads detects the UTF encoding of raw bytes itself, which keeps
+    # requests from running charset detection over the whole body.
+    return json.loads(response.content)
+
+
+@lru_cache(maxsize=None)
+def _host_origin(host: str) -> str:
+    return urllib.parse.urljoin(host, "/").rstrip("/")
+
+
+def _build_url(host: str, endpoint: str) -> str:
+    # Same result as urljoin for the absolute paths used by the API endpoints,
+    # without re-parsing the host on every call.
+    if endpoint.startswith("/") and not endpoint.startswith("//"):
+        return _host_origin(host) + endpoint
+    return urllib.parse.urljoin(host, endpoint)
+
 
 def call_api_v1(
     host: str,
@@ -20,15 +86,8 @@ def call_api_v1(
     json_data: dict = None,
     ca_path: str = "",
 ) -> requests.Response:
-    url = urllib.parse.urljoin(host, endpoint)
-    s = requests.Session()
-    retries = Retry(
-        total=3,
-        backoff_factor=0.1,
-        status_forcelist=[500, 502, 503, 504],
-    )
-    s.mount("http://", HTTPAdapter(max_retries=retries))
-    s.mount("https://", HTTPAdapter(max_retries=retries))
+    url = _build_url(host, endpoint)
+    s = _get_session()
     headers = {"Content-Type": "application/json"}
     resp = None
     try:
@@ -65,15 +124,8 @@ def call_api_v2(
     json_data: dict = None,
     ca_path: str = "",
 ) -> requests.Response:
-    url = urllib.parse.urljoin(host, endpoint)
-    s = requests.Session()
-    retries = Retry(
-        total=3,
-        backoff_factor=0.1,
-        status_forcelist=[500, 502, 503, 504],
-    )
-    s.mount("http://", HTTPAdapter(max_retries=retries))
-    s.mount("https://", HTTPAdapter(max_retries=retries))
+    url = _build_url(host, endpoint)
+    s = _get_session()
     headers = {
         "Content-Type": "application/json",
         "Authorization": "Bearer {}".format(user_token),
@@ -85,7 +137,7 @@ def call_api_v2(
                 method=method.upper(),
                 url=url,
                 headers=headers,
-                json=json_data,
+                data=serialize_json(json_data),
                 verify=ca_path if ca_path != "" else True,
             )
         else:
@@ -98,7 +150,7 @@ def call_api_v2(
         resp.raise_for_status()  # Raise an exception for 4xx or 5xx errors
         return resp
     except requests.exceptions.RequestException as e:
-        logging.warning(f"Error: {e}")
+        logging.warning("Error: %s", e)
         if resp != None and "application/json" in resp.headers.get("content-type"):
             logging.error("Error response from API: %s", resp.json())
         raise
@@ -107,113 +159,229 @@ def call_api_v2(
 def download_file(url: str, filepath: str, ca_path: str = ""):
     with requests.get(url, stream=True, verify=ca_path if ca_path != "" else True) as r:
         with open(filepath, "wb") as f:
-            shutil.copyfileobj(r.raw, f)
+            shutil.copyfileobj(r.raw, f, length=constants.DOWNLOAD_BUFFER_SIZE)
 
 
 def extract_fields(json_data, field_map):
+    # json_data is a flat dict or a FlattenedView; both resolve dotted paths.
     output = {}
     for old_field, new_field in field_map.items():
-        try:
-            value = json_data[old_field]
-        except KeyError:
-            continue
-        output[new_field] = value
+        value = json_data.get(old_field, _MISSING)
+        if value is not _MISSING:
+            output[new_field] = value
     return output
 
 
 def read_json_file(file_path):
-    with open(file_path, "r", encoding=utf_8.getregentry().name) as f:
-        json_data = json.load(f)
-    return json_data
+    with open(file_path, "rb") as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 def write_json_file(file_path, json_data):
-    with open(file_path, "w", encoding=utf_8.getregentry().name) as f:
-        json.dump(json_data, f)
-    # Set file permissions to 600 (read and write only for the owner)
-    os.chmod(file_path, 0o600)
+    if orjson is not None:
+        data = orjson.dumps(json_data, option=orjson.OPT_NON_STR_KEYS)
+    else:
+        # Encoded in one go: json.dump issues a separate write per token.
+        data = json.dumps(json_data, separators=(",", ":")).encode("utf-8")
+    # mkstemp creates the file with permissions 600 (read and write only for
+    # the owner), so the data is never readable by others, and the rename
+    # means readers never see a partially written file.
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(file_path) or ".",
+        prefix=os.path.basename(file_path) + ".",
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
 
 
-def flatten_json_data(json_data):
-    return flatten(json_data, ".")
+_MISSING = object()
+
+
+@lru_cache(maxsize=None)
+def _split_field_path(path: str) -> tuple:
+    return tuple(path.split("."))
+
+
+def _resolve_field_path(node, parts: tuple, start: int):
+    for position in range(start, len(parts)):
+        if not node:
+            return _MISSING
+        part = parts[position]
+        if isinstance(node, dict):
+            # A key may itself contain dots, as in {"a.b": 1} flattening to
+            # "a.b", so after the single part also try the longer joined keys.
+            for end in range(position + 1, len(parts) + 1):
+                key = part if end == position + 1 else ".".join(parts[position:end])
+                if key in node:
+                    value = _resolve_field_path(node[key], parts, end)
+                    if value is not _MISSING:
+                        return value
+            return _MISSING
+        elif isinstance(node, (list, tuple)):
+            if not part.isdigit() or str(int(part)) != part:
+                return _MISSING
+            index = int(part)
+            if index >= len(node):
+                return _MISSING
+            node = node[index]
+        else:
+            return _MISSING
+    if node and isinstance(node, (dict, list, tuple)):
+        return _MISSING
+    return node
 
 
-def get_best_runtime(json_list, edition, editor, kernel, short_version, full_version):
-    # Best match with all five criteria matching
-    for json_obj in json_list:
-        if (
-            "kernel" in json_obj
-            and "edition" in json_obj
-            and "editor" in json_obj
-            and "shortVersion" in json_obj
-            and "fullVersion" in json_obj
-        ):
-            if (
-                json_obj["kernel"] == kernel
-                and json_obj["edition"] == edition
-                and json_obj["editor"] == editor
-                and json_obj["shortVersion"] == short_version
-                and json_obj["fullVersion"] == full_version
-            ):
-                if "imageIdentifier" in json_obj:
-                    return json_obj["imageIdentifier"]
+class FlattenedView(object):
+    """Read-only view that resolves "a.b.0" keys on demand.
 
-    # Best match with four criteria matching
-    for json_obj in json_list:
-        if (
-            "kernel" in json_obj
-            and "edition" in json_obj
-            and "editor" in json_obj
-            and "shortVersion" in json_obj
-        ):
-            if (
-                json_obj["kernel"] == kernel
-                and json_obj["edition"] == edition
-                and json_obj["editor"] == editor
-                and json_obj["shortVersion"] == short_version
-            ):
-                if "imageIdentifier" in json_obj:
-                    return json_obj["imageIdentifier"]
+    Looks up the same keys with the same values as a flattened copy of the
+    data, without building the flat dict. Falsy values, including empty dicts
+    and lists, are leaves, and a non-empty dict or list is never a value of its
+    own.
+    """
 
-    # If not Atleast three criterias are matching
-    for json_obj in json_list:
-        if "kernel" in json_obj and "edition" in json_obj and "editor" in json_obj:
-            if (
-                json_obj["kernel"] == kernel
-                and json_obj["edition"] == edition
-                and json_obj["editor"] == editor
-            ):
-                if "imageIdentifier" in json_obj:
-                    return json_obj["imageIdentifier"]
+    __slots__ = ("_json_data",)
 
-    # If not atleast two criteria kernel and editor are matching
-    for json_obj in json_list:
-        if "kernel" in json_obj and "edition" in json_obj:
-            if json_obj["kernel"] == kernel and json_obj["editor"] == editor:
-                if "imageIdentifier" in json_obj:
-                    return json_obj["imageIdentifier"]
+    def __init__(self, json_data):
+        self._json_data = json_data
+
+    def _resolve(self, path: str):
+        return _resolve_field_path(self._json_data, _split_field_path(path), 0)
+
+    def __getitem__(self, path: str):
+        value = self._resolve(path)
+        if value is _MISSING:
+            raise KeyError(path)
+        return value
+
+    def __contains__(self, path: str) -> bool:
+        return self._resolve(path) is not _MISSING
+
+    def get(self, path: str, default=None):
+        value = self._resolve(path)
+        return default if value is _MISSING else value
 
-    # If not atleast kernel is matching
+
+def run_concurrently(func, items, max_workers: int = constants.MAX_API_WORKERS):
+    """Calls func on each item from a thread pool, returning results in input order.
+
+    items may be any iterable. It is consumed lazily, so that no more than
+    twice max_workers calls are queued at any time. The first exception raised
+    by func is re-raised to the caller and the queued calls are cancelled.
+    """
+    results = []
+    pending = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            for index, item in enumerate(items):
+                results.append(None)
+                pending[executor.submit(func, item)] = index
+                if len(pending) >= 2 * max_workers:
+                    _collect_completed(pending, results)
+            while pending:
+                _collect_completed(pending, results)
+        except Exception:
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise
+    return results
+
+
+def _collect_completed(pending: dict, results: list):
+    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+    for future in done:
+        results[pending.pop(future)] = future.result()
+
+
+# Match tiers for get_best_runtime, from the strictest to the loosest. Each tier
+# lists the fields a runtime must have and the fields compared with the request.
+_RUNTIME_MATCH_TIERS = (
+    (
+        ("kernel", "edition", "editor", "shortVersion", "fullVersion"),
+        ("kernel", "edition", "editor", "shortVersion", "fullVersion"),
+    ),
+    (
+        ("kernel", "edition", "editor", "shortVersion"),
+        ("kernel", "edition", "editor", "shortVersion"),
+    ),
+    (("kernel", "edition", "editor"), ("kernel", "edition", "editor")),
+    # Kernel and editor matching, for runtimes that also carry an edition.
+    (("kernel", "edition", "editor"), ("kernel", "editor")),
+    (("kernel",), ("kernel",)),
+)
+
+
+def build_runtime_index(json_list):
+    """Indexes runtimes once so that get_best_runtime is a dict lookup per tier.
+
+    The first runtime in list order wins within a tier, as with a linear scan.
+    """
+    runtime_index = tuple({} for _ in _RUNTIME_MATCH_TIERS)
     for json_obj in json_list:
-        if "kernel" in json_obj:
-            if json_obj["kernel"] == kernel:
-                if "imageIdentifier" in json_obj:
-                    return json_obj["imageIdentifier"]
+        if "imageIdentifier" not in json_obj:
+            continue
+        for tier_index, (required, compared) in zip(
+            runtime_index, _RUNTIME_MATCH_TIERS
+        ):
+            if all(field in json_obj for field in required):
+                tier_index.setdefault(
+                    tuple(json_obj[field] for field in compared),
+                    json_obj["imageIdentifier"],
+                )
+    return runtime_index
+
+
+def get_best_runtime(
+    runtime_index, edition, editor, kernel, short_version, full_version
+):
+    criteria = {
+        "kernel": kernel,
+        "edition": edition,
+        "editor": editor,
+        "shortVersion": short_version,
+        "fullVersion": full_version,
+    }
+    for tier_index, (_, compared) in zip(runtime_index, _RUNTIME_MATCH_TIERS):
+        runtime_identifier = tier_index.get(
+            tuple(criteria[field] for field in compared)
+        )
+        if runtime_identifier is not None:
+            return runtime_identifier
 
     return None
 
 
-def find_runtime(runtime_list, runtime_id: int):
+def _runtime_fields(runtime):
+    return {
+        "runtime_kernel": runtime["kernel"],
+        "runtime_edition": runtime["edition"],
+        "runtime_editor": runtime["editor"],
+        "runtime_fullversion": runtime["fullVersion"],
+        "runtime_shortversion": runtime["shortVersion"],
+    }
+
+
+def build_runtime_id_map(runtime_list):
+    # Keeps the first runtime per id, as a linear scan of the list would.
+    runtime_by_id = {}
     for runtime in runtime_list:
-        if "id" in runtime and runtime["id"] == runtime_id:
-            return {
-                "runtime_kernel": runtime["kernel"],
-                "runtime_edition": runtime["edition"],
-                "runtime_editor": runtime["editor"],
-                "runtime_fullversion": runtime["fullVersion"],
-                "runtime_shortversion": runtime["shortVersion"],
-            }
-    return None
+        if "id" in runtime:
+            runtime_by_id.setdefault(runtime["id"], runtime)
+    return runtime_by_id
+
+
+def find_runtime_by_id(runtime_by_id, runtime_id: int):
+    runtime = runtime_by_id.get(runtime_id)
+    if runtime is None:
+        return None
+    return _runtime_fields(runtime)
 
 
 def get_absolute_path(path: str) -> str:
@@ -229,6 +397,9 @@ def parse_runtimes_v2(runtimes):
     return legacy_runtime_image_map
 
 
+_LEGACY_KERNEL_LANGUAGES = (("Python", "python3"), ("R", "r"), ("Scala", "scala"))
+
+
 def _get_runtimes_v2(runtimes, editor="Workbench", edition="Standard"):
     legacy_runtime_image_map = {}
     legacy_runtime_kernel_map = {}
@@ -240,49 +411,21 @@ def _get_runtimes_v2(runtimes, editor="Workbench", edition="Standard"):
     )
 
     for image_details in runtimes:
-        if image_details["editor"] == editor and image_details["edition"] == edition:
-            if "Python" in image_details["kernel"]:
-                if "python3" not in legacy_runtime_image_map:
-                    legacy_runtime_kernel_map["python3"] = image_details["kernel"]
-                    legacy_runtime_image_map["python3"] = image_details[
-                        "image_identifier"
-                    ]
-                    legacy_runtime_image_map["python2"] = image_details[
-                        "image_identifier"
-                    ]
-                else:
-                    if image_details["kernel"] > legacy_runtime_kernel_map["python3"]:
-                        legacy_runtime_kernel_map["python3"] = image_details["kernel"]
-                        legacy_runtime_image_map["python3"] = image_details[
-                            "image_identifier"
-                        ]
-                        legacy_runtime_image_map["python2"] = image_details[
-                            "image_identifier"
-                        ]
-
-            if "R" in image_details["kernel"]:
-                if "r" not in legacy_runtime_image_map:
-                    legacy_runtime_kernel_map["r"] = image_details["kernel"]
-                    legacy_runtime_image_map["r"] = image_details["image_identifier"]
-                else:
-                    if image_details["kernel"] > legacy_runtime_kernel_map["r"]:
-                        legacy_runtime_kernel_map["r"] = image_details["kernel"]
-                        legacy_runtime_image_map["r"] = image_details[
-                            "image_identifier"
-                        ]
-
-            if "Scala" in image_details["kernel"]:
-                if "scala" not in legacy_runtime_image_map:
-                    legacy_runtime_kernel_map["scala"] = image_details["kernel"]
-                    legacy_runtime_image_map["scala"] = image_details[
-                        "image_identifier"
-                    ]
-                else:
-                    if image_details["kernel"] > legacy_runtime_kernel_map["scala"]:
-                        legacy_runtime_kernel_map["scala"] = image_details["kernel"]
-                        legacy_runtime_image_map["scala"] = image_details[
-                            "image_identifier"
-                        ]
+        if image_details["editor"] != editor or image_details["edition"] != edition:
+            continue
+        kernel = image_details["kernel"]
+        # A kernel may match more than one language marker, so check them all.
+        for marker, language in _LEGACY_KERNEL_LANGUAGES:
+            if marker in kernel and (
+                language not in legacy_runtime_kernel_map
+                or kernel > legacy_runtime_kernel_map[language]
+            ):
+                legacy_runtime_kernel_map[language] = kernel
+                legacy_runtime_image_map[language] = image_details["image_identifier"]
+
+    # Legacy python2 engines are mapped to the same runtime as python3
+    if "python3" in legacy_runtime_image_map:
+        legacy_runtime_image_map["python2"] = legacy_runtime_image_map["python3"]
 
     # Assigning Default runtime to Python3
     legacy_runtime_image_map["default"] = legacy_runtime_image_map["python3"]
@@ -293,10 +436,11 @@ def _get_runtimes_v2(runtimes, editor="Workbench", edition="Standard"):
 def compare_metadata(
     import_data, export_data, import_data_list, export_data_list, skip_field=None
 ):
-    if skip_field is None:
-        skip_field = []
+    skip_field = frozenset(skip_field or ())
 
-    data_list_diff = list(set(sorted(export_data_list)) - set(sorted(import_data_list)))
+    # Sorted for a stable report; key=str tolerates the None placeholder
+    # that the project lists use for a missing project.
+    data_list_diff = sorted(set(export_data_list) - set(import_data_list), key=str)
     config_differences = {}
 
     import_data_dict = {data["name"]: data for data in import_data}
@@ -309,20 +453,26 @@ def compare_metadata(
             continue
 
         for key, value in im_data.items():
-            if key not in skip_field:
-                ex_value = ex_data.get(key)
-                if ex_value is not None and str(ex_value) != str(value):
-                    difference = ["{} value in destination is {}, and source is {}".format(
-                        key, str(value), str(ex_value))]
-                    if config_differences.get(name):
-                        config_differences[name].extend(difference)
-                    else:
-                        config_differences[name]= difference
+            if key in skip_field:
+                continue
+            ex_value = ex_data.get(key)
+            if ex_value is None or ex_value is value:
+                continue
+            # Values are compared as strings; most already are, so skip str().
+            if type(value) is str and type(ex_value) is str:
+                value_str, ex_value_str = value, ex_value
+            else:
+                value_str, ex_value_str = str(value), str(ex_value)
+            if ex_value_str != value_str:
+                difference = "{} value in destination is {}, and source is {}".format(
+                    key, value_str, ex_value_str
+                )
+                config_differences.setdefault(name, []).append(difference)
     return data_list_diff, config_differences
 
 
 def update_verification_status(data_diff, message):
     if data_diff:
-        logging.info("\033[31m❌ {} Not Successful\033[0m".format(message))
+        logging.info("\033[31m❌ %s Not Successful\033[0m", message)
     else:
-        logging.info("\033[32m✔ {} Successful \033[0m".format(message))
+        logging.info("\033[32m✔ %s Successful \033[0m", message)
@@ -17,16 +17,114 @@ from cmlutils.projects import (
     is_project_configured_with_runtimes,
 )
 from cmlutils.script_models import ValidationResponse, ValidationResponseStatus
-from cmlutils.utils import call_api_v1
+from cmlutils.utils import call_api_v1, run_concurrently
+
+_USER_INFO_TEMPLATE = Template(ApiV1Endpoints.USER_INFO.value)
+_PROJECT_TEMPLATE = Template(ApiV1Endpoints.PROJECT.value)
+
+
+# Successful user and project lookups, keyed on their request arguments, so that
+# validators sharing a workspace and owner only query the API once. Failures are
+# not remembered, so a transient error is retried and logged on the next check.
+_existing_users = set()
+_existing_projects = set()
+
+
+def _user_lookup_status(host: str, username: str, apiv1_key: str, ca_path: str) -> int:
+    lookup_key = (host, username, apiv1_key, ca_path)
+    if lookup_key in _existing_users:
+        return 200
+    endpoint = _USER_INFO_TEMPLATE.substitute(username=username)
+    try:
+        call_api_v1(
+            host=host,
+            endpoint=endpoint,
+            method="GET",
+            api_key=apiv1_key,
+            ca_path=ca_path,
+        )
+        _existing_users.add(lookup_key)
+        return 200
+    except HTTPError as e:
+        if e.response.status_code == 404:
+            logging.error("Username does not exist %s", e.response.json())
+        elif e.response.status_code == 401:
+            logging.error("Unauthorized for url %s", e.response.json())
+        else:
+            logging.error(e.response.json())
+        return e.response.status_code
+
+
+def _validate_username(
+    validation_name: str,
+    host: str,
+    username: str,
+    apiv1_key: str,
+    project_name: str,
+    ca_path: str,
+) -> ValidationResponse:
+    status_code = _user_lookup_status(
+        host=host, username=username, apiv1_key=apiv1_key, ca_path=ca_path
+    )
+    if status_code == 200:
+        return ValidationResponse(
+            validation_name=validation_name,
+            validation_msg="The user name exists.",
+            validation_status=ValidationResponseStatus.PASSED,
+        )
+    if status_code == 404:
+        msg = "The user name does not exist. Ensure that the user name provided for the project {} is correct.".format(
+            project_name
+        )
+    elif status_code == 401:
+        msg = "The user is unauthorised. Ensure that the API key for the project {} is correct".format(
+            project_name
+        )
+    else:
+        msg = "Exception occurred while validating username"
+    return ValidationResponse(
+        validation_name=validation_name,
+        validation_msg=msg,
+        validation_status=ValidationResponseStatus.FAILED,
+    )
+
+
+def _project_exists(
+    host: str, username: str, project_slug: str, apiv1_key: str, ca_path: str
+) -> bool:
+    lookup_key = (host, username, project_slug, apiv1_key, ca_path)
+    if lookup_key in _existing_projects:
+        return True
+    endpoint = _PROJECT_TEMPLATE.substitute(
+        username=username, project_name=project_slug
+    )
+    try:
+        call_api_v1(
+            host=host,
+            endpoint=endpoint,
+            method="GET",
+            api_key=apiv1_key,
+            ca_path=ca_path,
+        )
+        _existing_projects.add(lookup_key)
+        return True
+    except HTTPError:
+        logging.error("Project does not exist")
+        return False
 
 
 class ImportValidators(metaclass=ABCMeta):
+    # Local validators only look at the filesystem and are run first.
+    is_local = False
+
     @abstractmethod
     def validate(self) -> ValidationResponse:
         pass
 
 
 class DirectoriesAndFilesValidator(ImportValidators):
+    is_local = True
+
     def __init__(self, username: str, project_name: str, top_level_directory: str):
         self.username = username
         self.project_name = project_name
@@ -66,63 +164,6 @@ class DirectoriesAndFilesValidator(ImportValidators):
         )
 
 
-class UserNameImportValidator(ImportValidators):
-    def __init__(
-        self, host: str, username: str, apiv1_key: str, project_name: str, ca_path: str
-    ):
-        self.validation_name = "check if user is present"
-        self.host = host
-        self.username = username
-        self.apiv1_key = apiv1_key
-        self.project_name = project_name
-        self.ca_path = ca_path
-
-    def validate(self) -> ValidationResponse:
-        endpoint = Template(ApiV1Endpoints.USER_INFO.value).substitute(
-            username=self.username
-        )
-        try:
-            response = call_api_v1(
-                host=self.host,
-                endpoint=endpoint,
-                method="GET",
-                api_key=self.apiv1_key,
-                ca_path=self.ca_path,
-            )
-            return ValidationResponse(
-                validation_name=self.validation_name,
-                validation_msg="The user name exists.",
-                validation_status=ValidationResponseStatus.PASSED,
-            )
-        except HTTPError as e:
-            logging.info("e", e.response.status_code)
-            if e.response.status_code == 404:
-                logging.error("Username does not exist %s", e.response.json())
-                return ValidationResponse(
-                    validation_name=self.validation_name,
-                    validation_msg="The user name does not exist. Ensure that the user name provided for the project {} is correct.".format(
-                        self.project_name
-                    ),
-                    validation_status=ValidationResponseStatus.FAILED,
-                )
-            elif e.response.status_code == 401:
-                logging.error("Unauthorized for url %s", e.response.json())
-                return ValidationResponse(
-                    validation_name=self.validation_name,
-                    validation_msg="The user is unauthorised. Ensure that the API key for the project {} is correct".format(
-                        self.project_name
-                    ),
-                    validation_status=ValidationResponseStatus.FAILED,
-                )
-            else:
-                logging.error(e.response.json())
-                return ValidationResponse(
-                    validation_name=self.validation_name,
-                    validation_msg="Exception occurred while validating username",
-                    validation_status=ValidationResponseStatus.FAILED,
-                )
-
-
 class RsyncRuntimeAddonExistsImportValidator(ImportValidators):
     def __init__(
         self, host: str, username: str, apiv1_key: str, project_name: str, ca_path: str
@@ -153,12 +194,16 @@ class RsyncRuntimeAddonExistsImportValidator(ImportValidators):
 
 
 class ExportValidators(metaclass=ABCMeta):
+    # Local validators only look at the filesystem and are run first.
+    is_local = False
+
     @abstractmethod
     def validate(self) -> ValidationResponse:
         pass
 
 
-class UsernameValidator(ExportValidators):
+# The user check is the same for import and export, so one class serves both.
+class UsernameValidator(ImportValidators, ExportValidators):
     def __init__(
         self, host: str, username: str, apiv1_key: str, project_name: str, ca_path: str
     ):
@@ -170,49 +215,17 @@ class UsernameValidator(ExportValidators):
         self.ca_path = ca_path
 
     def validate(self) -> ValidationResponse:
-        endpoint = Template(ApiV1Endpoints.USER_INFO.value).substitute(
-            username=self.username
+        return _validate_username(
+            validation_name=self.validation_name,
+            host=self.host,
+            username=self.username,
+            apiv1_key=self.apiv1_key,
+            project_name=self.project_name,
+            ca_path=self.ca_path,
         )
-        try:
-            response = call_api_v1(
-                host=self.host,
-                endpoint=endpoint,
-                method="GET",
-                api_key=self.apiv1_key,
-                ca_path=self.ca_path,
-            )
-            return ValidationResponse(
-                validation_name=self.validation_name,
-                validation_msg="The user name exists.",
-                validation_status=ValidationResponseStatus.PASSED,
-            )
-        except HTTPError as e:
-            logging.info("e", e.response.status_code)
-            if e.response.status_code == 404:
-                logging.error("Username does not exist %s", e.response.json())
-                return ValidationResponse(
-                    validation_name=self.validation_name,
-                    validation_msg="The user name does not exist. Ensure that the user name provided for the project {} is correct.".format(
-                        self.project_name
-                    ),
-                    validation_status=ValidationResponseStatus.FAILED,
-                )
-            elif e.response.status_code == 401:
-                logging.error("Unauthorized for url %s", e.response.json())
-                return ValidationResponse(
-                    validation_name=self.validation_name,
-                    validation_msg="The user is unauthorised. Ensure that the API key for the project {} is correct ".format(
-                        self.project_name
-                    ),
-                    validation_status=ValidationResponseStatus.FAILED,
-                )
-            else:
-                logging.error(e.response.json())
-                return ValidationResponse(
-                    validation_name=self.validation_name,
-                    validation_msg="Exception occurred while validating username",
-                    validation_status=ValidationResponseStatus.FAILED,
-                )
+
+
+UserNameImportValidator = UsernameValidator
 
 
 class ProjectBelongsToUserValidator(ExportValidators):
@@ -237,34 +250,30 @@ class ProjectBelongsToUserValidator(ExportValidators):
         self.project_slug = project_slug
 
     def validate(self) -> ValidationResponse:
-        endpoint = Template(ApiV1Endpoints.PROJECT.value).substitute(
-            username=self.username, project_name=self.project_slug
-        )
-        try:
-            response = call_api_v1(
-                host=self.host,
-                endpoint=endpoint,
-                method="GET",
-                api_key=self.apiv1_key,
-                ca_path=self.ca_path,
-            )
+        if _project_exists(
+            host=self.host,
+            username=self.username,
+            project_slug=self.project_slug,
+            apiv1_key=self.apiv1_key,
+            ca_path=self.ca_path,
+        ):
             return ValidationResponse(
                 validation_name=self.validation_name,
                 validation_msg="Project is present",
                 validation_status=ValidationResponseStatus.PASSED,
             )
-        except HTTPError:
-            logging.error("Project does not exist")
-            return ValidationResponse(
-                validation_name=self.validation_name,
-                validation_msg="Project - {} does not exist. Ensure that the project name provided is correct.".format(
-                    self.project_name
-                ),
-                validation_status=ValidationResponseStatus.FAILED,
-            )
+        return ValidationResponse(
+            validation_name=self.validation_name,
+            validation_msg="Project - {} does not exist. Ensure that the project name provided is correct.".format(
+                self.project_name
+            ),
+            validation_status=ValidationResponseStatus.FAILED,
+        )
 
 
 class TopLevelDirectoryValidator(ExportValidators):
+    is_local = True
+
     def __init__(self, top_level_directory: str):
         self.validation_name = "validate if output directory exists"
         self.top_level_dir = top_level_directory
@@ -351,7 +360,7 @@ def initialize_import_validators(
             project_name=project_name,
             top_level_directory=top_level_directory,
         ),
-        UserNameImportValidator(
+        UsernameValidator(
             host=host,
             username=username,
             apiv1_key=apiv1_key,
@@ -403,3 +412,20 @@ def initialize_export_validators(
             project_slug=project_slug,
         ),
     ]
+
+
+def run_validators(
+    validators: List[ImportValidators | ExportValidators],
+) -> List[ValidationResponse]:
+    # Cheap local checks run first so that a missing directory fails before any
+    # API call is made. The remaining validators are independent and mostly
+    # wait on API calls, so they run together in validator order.
+    responses = []
+    for v in validators:
+        if v.is_local:
+            response = v.validate()
+            responses.append(response)
+            if response.validation_status == ValidationResponseStatus.FAILED:
+                return responses
+    remote_validators = [v for v in validators if not v.is_local]
+    return responses + run_concurrently(lambda v: v.validate(), remote_validators)
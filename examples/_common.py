@@ -0,0 +1,73 @@
+# Copyright (c) 2023 Cloudera, Inc. All rights reserved.
+# Author: Cloudera
+# Description: Helpers shared by the batch example scripts.
+
+import json
+import os
+import subprocess
+from configparser import ConfigParser, NoOptionError, NoSectionError
+
+# NOTE: Do not change this
+OUTPUT_DIR_KEY = "output_dir"
+IMPORT_METRIC_FILE = "logs/import_metrics.json"
+# Answers to confirmation prompts, fed over stdin instead of piping from `yes`.
+CONFIRMATIONS = b"y\n" * 20
+
+
+# Run a cmlutil project command without a shell.
+def run_project_command(*args: str):
+    subprocess.run(["cmlutil", "project", *args], input=CONFIRMATIONS)
+
+
+def get_absolute_path(path: str) -> str:
+    if path.startswith("~"):
+        return path.replace("~", os.path.expanduser("~"), 1)
+    return os.path.abspath(path=path)
+
+
+# Read an export/import config file once; its sections are the project names.
+def read_config_file(file_path: str) -> ConfigParser:
+    config = ConfigParser()
+    if os.path.exists(file_path):
+        config.read(file_path)
+        return config
+    else:
+        print("Validation error: cannot find config file:", file_path)
+        raise RuntimeError("validation error", "Cannot find config file")
+
+
+def lookup_output_dir(config: ConfigParser, project_name: str) -> str:
+    try:
+        return config.get(project_name, OUTPUT_DIR_KEY)
+    except NoSectionError:
+        print("Project %s is missing from config file." % (project_name))
+        raise
+    except NoOptionError:
+        print(
+            "Key %s is missing from config file for project %s."
+            % (OUTPUT_DIR_KEY, project_name)
+        )
+        raise
+
+
+# Resolve the output directory of every project up front, so that workers only
+# do a dict lookup.
+def read_output_dirs(config: ConfigParser, project_names: list) -> dict:
+    return {name: lookup_output_dir(config, name) for name in project_names}
+
+
+# Check the import metrics of a project for a successful migration validation.
+def migration_validate(project_name: str, output_dir: str) -> bool:
+    import_metrics_file_path = os.path.join(
+        get_absolute_path(output_dir), project_name, IMPORT_METRIC_FILE
+    )
+
+    try:
+        with open(import_metrics_file_path, "r") as file:
+            data = json.load(file)
+    except FileNotFoundError:
+        is_migration_successful = False
+    else:
+        # Access the value of the isMigrationSuccessful key
+        is_migration_successful = data.get("isMigrationSuccessful", False)
+    return is_migration_successful
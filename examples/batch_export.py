@@ -3,39 +3,23 @@
 # Description: An example script to perform batch export of projects.
 
 import os
-import shlex
-import subprocess
-from configparser import ConfigParser
 from multiprocessing.pool import ThreadPool
 
+from _common import read_config_file, run_project_command
+
 # This variable controls the number of threads that can run simultaneously.
 BATCH_SIZE = 10
 
 
 # Export a single project using cmlutility.
 def export_project(project_name: str):
-    export_command = "yes | cmlutil project export -p  {}".format(
-        shlex.quote(project_name)
-    )
-    subprocess.run(export_command, shell=True)
-
-
-# Read list of section/project names from export-config.ini
-def _get_project_list(file_path: str):
-    config = ConfigParser()
-    if os.path.exists(file_path):
-        config.read(file_path)
-        project_names = config.sections()
-        return project_names
-    else:
-        print("Validation error: cannot find config file:", file_path)
-        raise RuntimeError("validation error", "Cannot find config file")
+    run_project_command("export", "-p", project_name)
 
 
 def main():
-    project_names = _get_project_list(
+    project_names = read_config_file(
         os.path.expanduser("~") + "/.cmlutils/export-config.ini"
-    )
+    ).sections()
     print(project_names)
     project_iter = []
     for project in project_names:
@@ -3,14 +3,15 @@
 # Description: An example script to perform batch import of projects.
 
 import os
-import shlex
-import json
-import subprocess
-from configparser import ConfigParser
 from multiprocessing.pool import ThreadPool
 
-OUTPUT_DIR_KEY = "output_dir"
-IMPORT_METRIC_FILE = "logs/import_metrics.json"
+from _common import (
+    migration_validate,
+    read_config_file,
+    read_output_dirs,
+    run_project_command,
+)
+
 # This variable controls the number of threads that can run simultaneously.
 BATCH_SIZE = 10
 
@@ -19,91 +20,36 @@ BATCH_SIZE = 10
 VERIFY = False
 
 
-# import a single project using cmlutility.
-def import_project(project_name: str):
+# import a single project using cmlutility, and report whether its migration
+# validation succeeded when VERIFY is set.
+def import_project(project_name: str, output_dir: str = None):
     if VERIFY:
-        import_command = "yes | cmlutil project import -p  {} --verify".format(
-            shlex.quote(project_name)
-        )
-    else:
-        import_command = "yes | cmlutil project import -p  {}".format(
-            shlex.quote(project_name)
-        )
-    subprocess.run(import_command, shell=True)
-
-
-def get_absolute_path(path: str) -> str:
-    if path.startswith("~"):
-        return path.replace("~", os.path.expanduser("~"), 1)
-    return os.path.abspath(path=path)
-
-
-def import_validate(project_name: str):
-    output_dir = _read_config_file((os.path.expanduser("~") + "/.cmlutils/import-config.ini"),
-                            project_name)
-    import_metrics_file_path = os.path.join(get_absolute_path(output_dir[OUTPUT_DIR_KEY]), project_name, IMPORT_METRIC_FILE)
-
-    try:
-        with open(import_metrics_file_path, "r") as file:
-            data = json.load(file)
-    except FileNotFoundError:
-        is_migration_successful = False
-    else:
-        # Access the value of the isMigrationSuccessful key
-        is_migration_successful = data.get("isMigrationSuccessful", False)
-    return is_migration_successful
-
-
-def _read_config_file(file_path: str, project_name: str):
-    output_config = {}
-    config = ConfigParser()
-    if os.path.exists(file_path):
-        config.read(file_path)
-        key = OUTPUT_DIR_KEY
-        try:
-            value = config.get(project_name, key)
-            output_config.setdefault(key, value)
-        except NoOptionError:
-            print("Key %s is missing from config file." % (key))
-            raise
-        return output_config
-    else:
-        print("Validation error: cannot find config file:", file_path)
-        raise RuntimeError("validation error", "Cannot find config file")
-
-
-# Read list of section/project names from import-config.ini
-def _get_project_list(file_path: str):
-    config = ConfigParser()
-    if os.path.exists(file_path):
-        config.read(file_path)
-        project_names = config.sections()
-        return project_names
+        run_project_command("import", "-p", project_name, "--verify")
     else:
-        print("Validation error: cannot find config file:", file_path)
-        raise RuntimeError("validation error", "Cannot find config file")
+        run_project_command("import", "-p", project_name)
+    if VERIFY:
+        return migration_validate(project_name, output_dir)
 
 
 def main():
     failed_validation_list = list()
-    project_names = _get_project_list(
-        os.path.expanduser("~") + "/.cmlutils/import-config.ini"
-    )
+    config = read_config_file(os.path.expanduser("~") + "/.cmlutils/import-config.ini")
+    project_names = config.sections()
+    output_dirs = read_output_dirs(config, project_names) if VERIFY else {}
     project_iter = []
 
     for project in project_names:
-        element = [project]
+        element = [project, output_dirs.get(project)]
         project_iter.append(element)
 
     # create a thread pool
     with ThreadPool(BATCH_SIZE) as pool:
         # call a function on each item in a list
-        pool.starmap(import_project, project_iter)
+        results = pool.starmap(import_project, project_iter)
 
     # validation summary if VERIFY=True
     if VERIFY:
-        for project in project_names:
-            result = import_validate(project)
+        for project, result in zip(project_names, results):
             if not result:
                 failed_validation_list.append(project)
 
@@ -3,16 +3,15 @@
 # Description: An example script to perform batch validation of projects.
 
 import os
-import shlex
 import csv
-import json
-import subprocess
-from configparser import ConfigParser
 from multiprocessing.pool import ThreadPool
-# NOTE: Do not change this
-OUTPUT_DIR_KEY = "output_dir"
-IMPORT_METRIC_FILE = "logs/import_metrics.json"
 
+from _common import (
+    migration_validate,
+    read_config_file,
+    read_output_dirs,
+    run_project_command,
+)
 
 # Absolute path to the project name list csv.
 PROJECT_LIST_CSV_FILE = "/Users/clouderauser/Desktop/nn.csv"
@@ -21,54 +20,11 @@ PROJECT_LIST_CSV_FILE = "/Users/clouderauser/Desktop/nn.csv"
 BATCH_SIZE = 2
 
 
-# validate a single project using cmlutility.
+# validate a single project using cmlutility and report whether it succeeded.
+def validate_project(project_name: str, output_dir: str):
 
-def validate_project(project_name: str):
-
-    validate_command = "yes | cmlutil project validate-migration -p  {}".format(
-        shlex.quote(project_name)
-    )
-    subprocess.run(validate_command, shell=True)
-
-
-def get_absolute_path(path: str) -> str:
-    if path.startswith("~"):
-        return path.replace("~", os.path.expanduser("~"), 1)
-    return os.path.abspath(path=path)
-
-
-def migration_validate(project_name: str):
-    output_dir = _read_config_file((os.path.expanduser("~") + "/.cmlutils/import-config.ini"),
-                            project_name)
-    import_metrics_file_path = os.path.join(get_absolute_path(output_dir[OUTPUT_DIR_KEY]), project_name, IMPORT_METRIC_FILE)
-
-    try:
-        with open(import_metrics_file_path, "r") as file:
-            data = json.load(file)
-    except FileNotFoundError:
-        is_migration_successful = False
-    else:
-        # Access the value of the isMigrationSuccessful key
-        is_migration_successful = data.get("isMigrationSuccessful", False)
-    return is_migration_successful
-
-
-def _read_config_file(file_path: str, project_name: str):
-    output_config = {}
-    config = ConfigParser()
-    if os.path.exists(file_path):
-        config.read(file_path)
-        key = OUTPUT_DIR_KEY
-        try:
-            value = config.get(project_name, key)
-            output_config.setdefault(key, value)
-        except NoOptionError:
-            print("Key %s is missing from config file." % (key))
-            raise
-        return output_config
-    else:
-        print("Validation error: cannot find config file:", file_path)
-        raise RuntimeError("validation error", "Cannot find config file")
+    run_project_command("validate-migration", "-p", project_name)
+    return migration_validate(project_name, output_dir)
 
 
 def fetch_project_names_from_csv(csv_file):
@@ -86,20 +42,21 @@ def fetch_project_names_from_csv(csv_file):
 def main():
     failed_validation_list = list()
     project_names = fetch_project_names_from_csv(PROJECT_LIST_CSV_FILE)
+    config = read_config_file(os.path.expanduser("~") + "/.cmlutils/import-config.ini")
+    output_dirs = read_output_dirs(config, project_names)
     project_iter = []
 
     for project in project_names:
-        element = [project]
+        element = [project, output_dirs[project]]
         project_iter.append(element)
 
     # create a thread pool
     with ThreadPool(BATCH_SIZE) as pool:
         # call a function on each item in a list
-        pool.starmap(validate_project, project_iter)
+        results = pool.starmap(validate_project, project_iter)
 
     # validation summary
-    for project in project_names:
-        result = migration_validate(project)
+    for project, result in zip(project_names, results):
         if not result:
             failed_validation_list.append(project)
 
@@ -0,0 +1,129 @@
+import json
+import unittest
+import urllib.parse
+from unittest import mock
+
+from cmlutils.constants import ApiV2Endpoints
+from cmlutils import projects
+from cmlutils.projects import (
+    ProjectImporter,
+    _dedupe_by_key,
+    _parse_verify_output,
+    get_rsync_enabled_runtime_id,
+)
+
+
+class TestParseVerifyOutput(unittest.TestCase):
+    def test_skips_deleted_dot_files(self):
+        self.assertEqual(_parse_verify_output("deleting .cache/x\n"), [])
+
+    def test_skips_current_directory(self):
+        self.assertEqual(_parse_verify_output("./\n"), [])
+
+    def test_keeps_deleted_files(self):
+        self.assertEqual(_parse_verify_output("deleting foo\n"), ["foo"])
+
+    def test_mixed_output(self):
+        output = "./\ndeleting .cache/x\ndeleting foo\n./src/main.py\n.bashrc\n\n"
+        self.assertEqual(_parse_verify_output(output), ["foo", "src/main.py"])
+
+
+class TestDedupeByKey(unittest.TestCase):
+    def test_routes_duplicates_to_first_item(self):
+        jobs = [
+            {"name": "a", "script": "a.py"},
+            {"name": "b", "script": "b.py"},
+            {"name": "a", "script": "a.py"},
+            {"name": "a", "script": "other.py"},
+        ]
+        unique, duplicates, positions = _dedupe_by_key(
+            jobs, lambda job: (job["name"], job["script"])
+        )
+        self.assertEqual(unique, [jobs[0], jobs[1], jobs[3]])
+        self.assertEqual(duplicates, [jobs[2]])
+        self.assertEqual(positions, [0, 1, 0, 2])
+
+
+class TestListAllV2(unittest.TestCase):
+    def setUp(self):
+        self.importer = ProjectImporter(
+            host="https://cml.example.com",
+            username="user",
+            project_name="project",
+            api_key="key",
+            top_level_dir="/tmp",
+            ca_path=None,
+            project_slug="project",
+        )
+        # Keep apiv2_key from minting a key over the network.
+        self.importer.apiv2_key = "v2-key"
+
+    def _pages(self, pages):
+        responses = []
+        for items, next_page_token in pages:
+            response = mock.Mock()
+            response.content = json.dumps(
+                {"jobs": items, "next_page_token": next_page_token}
+            ).encode("utf-8")
+            responses.append(response)
+        return responses
+
+    def test_collects_every_page(self):
+        pages = [
+            ([{"id": "1"}, {"id": "2"}], "token/1"),
+            ([{"id": "3"}], "token 2"),
+            ([{"id": "4"}, {"id": "5"}], ""),
+        ]
+        with mock.patch(
+            "cmlutils.base.call_api_v2", side_effect=self._pages(pages)
+        ) as call_api_v2:
+            jobs = self.importer._list_all_v2(
+                ApiV2Endpoints.JOBS_PAGE, result_key="jobs", proj_id="p1"
+            )
+        self.assertEqual([job["id"] for job in jobs], ["1", "2", "3", "4", "5"])
+        self.assertEqual(call_api_v2.call_count, 3)
+        requested_tokens = [
+            urllib.parse.parse_qs(
+                urllib.parse.urlsplit(call.kwargs["endpoint"]).query,
+                keep_blank_values=True,
+            )["page_token"][0]
+            for call in call_api_v2.call_args_list
+        ]
+        self.assertEqual(requested_tokens, ["", "token/1", "token 2"])
+
+    def test_missing_next_page_token_ends_listing(self):
+        response = mock.Mock()
+        response.content = json.dumps({"jobs": [{"id": "1"}]}).encode("utf-8")
+        with mock.patch(
+            "cmlutils.base.call_api_v2", return_value=response
+        ) as call_api_v2:
+            jobs = self.importer._list_all_v2(
+                ApiV2Endpoints.JOBS_PAGE, result_key="jobs", proj_id="p1"
+            )
+        self.assertEqual(jobs, [{"id": "1"}])
+        call_api_v2.assert_called_once()
+
+
+class TestRsyncRuntimeId(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.dict(projects._rsync_runtime_ids, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_found_runtime_is_cached_per_workspace(self):
+        runtimes = [{"id": 1, "edition": "Standard"}, {"id": 7, "edition": "rsync"}]
+        with mock.patch.object(
+            projects, "get_cdsw_runtimes", return_value=runtimes
+        ) as get_cdsw_runtimes:
+            self.assertEqual(get_rsync_enabled_runtime_id("host", "key", None), 7)
+            self.assertEqual(get_rsync_enabled_runtime_id("host", "other", None), 7)
+        get_cdsw_runtimes.assert_called_once()
+
+    def test_missing_runtime_is_looked_up_again(self):
+        with mock.patch.object(
+            projects,
+            "get_cdsw_runtimes",
+            side_effect=[[], [{"id": 7, "edition": "Rsync Standard"}]],
+        ):
+            self.assertEqual(get_rsync_enabled_runtime_id("host", "key", None), -1)
+            self.assertEqual(get_rsync_enabled_runtime_id("host", "key", None), 7)
@@ -0,0 +1,61 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from cmlutils import ssh
+
+
+class TestOpenSshEndpoint(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    # Write a stand-in for cdswctl that runs the given shell script.
+    def _fake_cdswctl(self, script):
+        path = os.path.join(self.tmp.name, "cdswctl")
+        with open(path, "w") as f:
+            f.write("#!/bin/sh\n" + script)
+        os.chmod(path, 0o700)
+        return path
+
+    def _open(self, cdswctl_path):
+        return ssh.open_ssh_endpoint(cdswctl_path, "project", -1, "user/project")
+
+    @mock.patch.object(ssh, "start_ssh_master")
+    def test_chatty_stderr_does_not_block_endpoint(self, start_ssh_master):
+        # Far more than a pipe buffer holds, before the port line is printed.
+        cdswctl = self._fake_cdswctl(
+            "i=0\n"
+            "while [ $i -lt 2000 ]; do\n"
+            "  echo 'some diagnostic output from the endpoint' >&2\n"
+            "  i=$((i + 1))\n"
+            "done\n"
+            "echo 'Forwarding local port 2222 to port 22'\n"
+            "trap 'echo stopped >&2; exit 0' INT\n"
+            "while true; do sleep 0.05; done\n"
+        )
+        ssh_call, port = self._open(cdswctl)
+        self.assertEqual(port, 2222)
+        start_ssh_master.assert_called_once_with(2222)
+        error = ssh.stop_ssh_endpoint(ssh_call)
+        self.assertIn("some diagnostic output", error)
+        self.assertEqual(ssh._stderr_files, {})
+
+    @mock.patch.object(ssh.constants, "SSH_ENDPOINT_START_TIMEOUT_SECONDS", 0.5)
+    def test_partial_line_times_out(self):
+        cdswctl = self._fake_cdswctl(
+            "printf 'Forwarding local port'\n"
+            "echo 'still starting' >&2\n"
+            "trap 'exit 0' INT\n"
+            "while true; do sleep 0.05; done\n"
+        )
+        with self.assertLogs(level="ERROR") as logs:
+            self.assertEqual(self._open(cdswctl), (None, -1))
+        self.assertIn("still starting", logs.output[0])
+
+    def test_exit_without_output_reports_stderr(self):
+        cdswctl = self._fake_cdswctl("echo 'project not found' >&2\nexit 1\n")
+        with self.assertLogs(level="ERROR") as logs:
+            self.assertEqual(self._open(cdswctl), (None, -1))
+        self.assertIn("project not found", logs.output[0])
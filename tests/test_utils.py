@@ -0,0 +1,348 @@
+import itertools
+import json
+import os
+import stat
+import tempfile
+import threading
+import time
+import unittest
+
+from cmlutils.utils import (
+    FlattenedView,
+    build_runtime_id_map,
+    build_runtime_index,
+    compare_metadata,
+    extract_fields,
+    find_runtime_by_id,
+    get_best_runtime,
+    run_concurrently,
+    write_json_file,
+)
+
+
+class TestRunConcurrently(unittest.TestCase):
+    def test_results_keep_input_order(self):
+        def slow_for_early_items(item):
+            # Earlier items finish last.
+            time.sleep((5 - item) * 0.01)
+            return item * 10
+
+        self.assertEqual(
+            run_concurrently(slow_for_early_items, range(5), max_workers=5),
+            [0, 10, 20, 30, 40],
+        )
+
+    def test_bounds_submitted_calls(self):
+        lock = threading.Lock()
+        counts = {"pulled": 0, "finished": 0, "max_outstanding": 0}
+
+        def items():
+            for item in range(20):
+                with lock:
+                    counts["pulled"] += 1
+                    counts["max_outstanding"] = max(
+                        counts["max_outstanding"],
+                        counts["pulled"] - counts["finished"],
+                    )
+                yield item
+
+        def work(item):
+            time.sleep(0.01)
+            with lock:
+                counts["finished"] += 1
+            return item
+
+        self.assertEqual(
+            run_concurrently(work, items(), max_workers=2), list(range(20))
+        )
+        self.assertLessEqual(counts["max_outstanding"], 4)
+
+    def test_first_exception_cancels_pending_calls(self):
+        release = threading.Event()
+        started = []
+
+        def work(item):
+            started.append(item)
+            if item == 0:
+                raise ValueError("boom")
+            # Keep both workers busy so that later calls stay queued.
+            release.wait(timeout=5)
+            return item
+
+        timer = threading.Timer(0.3, release.set)
+        timer.start()
+        try:
+            with self.assertRaises(ValueError):
+                run_concurrently(work, range(10), max_workers=2)
+        finally:
+            timer.cancel()
+            release.set()
+        # Items 0-3 were submitted; 3 was still queued when 0 failed.
+        self.assertNotIn(3, started)
+        self.assertTrue(all(item < 4 for item in started))
+
+
+class TestFlattenedView(unittest.TestCase):
+    def setUp(self):
+        self.view = FlattenedView(
+            {
+                "name": "job",
+                "schedule": {"cron": {"expression": "0 * * * *"}},
+                "a.b": 1,
+                "kernel": {"python.version": "3.10"},
+                "recipients": [{"email": "a@b.c"}, {"email": "d@e.f"}],
+                "empty": {},
+                "count": 0,
+            }
+        )
+
+    def test_nested_dotted_path(self):
+        self.assertEqual(self.view["schedule.cron.expression"], "0 * * * *")
+
+    def test_key_containing_a_dot(self):
+        self.assertEqual(self.view["a.b"], 1)
+        self.assertEqual(self.view["kernel.python.version"], "3.10")
+
+    def test_missing_intermediate_key(self):
+        self.assertNotIn("schedule.missing.expression", self.view)
+        self.assertEqual(self.view.get("schedule.missing.expression", "d"), "d")
+        self.assertIsNone(self.view.get("schedule.missing.expression"))
+        with self.assertRaises(KeyError):
+            self.view["schedule.missing.expression"]
+
+    def test_list_values(self):
+        self.assertEqual(self.view["recipients.1.email"], "d@e.f")
+        self.assertNotIn("recipients.2.email", self.view)
+        self.assertNotIn("recipients.01.email", self.view)
+
+    def test_falsy_values_are_leaves(self):
+        self.assertEqual(self.view["empty"], {})
+        self.assertEqual(self.view["count"], 0)
+        # A non-empty dict is not a value of its own.
+        self.assertNotIn("schedule", self.view)
+
+    def test_extract_fields_leaves_out_absent_paths(self):
+        self.assertEqual(
+            extract_fields(
+                self.view,
+                {
+                    "name": "job_name",
+                    "schedule.cron.expression": "cron",
+                    "schedule.missing": "missing",
+                    "count": "count",
+                },
+            ),
+            {"job_name": "job", "cron": "0 * * * *", "count": 0},
+        )
+
+
+# The tiered linear scan that build_runtime_index and get_best_runtime replace.
+_BASELINE_TIERS = (
+    ("kernel", "edition", "editor", "shortVersion", "fullVersion"),
+    ("kernel", "edition", "editor", "shortVersion"),
+    ("kernel", "edition", "editor"),
+    ("kernel", "editor"),
+    ("kernel",),
+)
+
+
+def _baseline_best_runtime(runtimes, edition, editor, kernel, short, full):
+    criteria = {
+        "kernel": kernel,
+        "edition": edition,
+        "editor": editor,
+        "shortVersion": short,
+        "fullVersion": full,
+    }
+    for fields in _BASELINE_TIERS:
+        for runtime in runtimes:
+            if all(field in runtime for field in fields) and all(
+                runtime[field] == criteria[field] for field in fields
+            ):
+                if "imageIdentifier" in runtime:
+                    return runtime["imageIdentifier"]
+    return None
+
+
+def _runtime(image, kernel, edition, editor, short, full, runtime_id=None):
+    runtime = {
+        "imageIdentifier": image,
+        "kernel": kernel,
+        "edition": edition,
+        "editor": editor,
+        "shortVersion": short,
+        "fullVersion": full,
+    }
+    if runtime_id is not None:
+        runtime["id"] = runtime_id
+    return runtime
+
+
+class TestRuntimeLookup(unittest.TestCase):
+    def setUp(self):
+        self.runtimes = [
+            _runtime(
+                "py-wb-std-1", "Python 3.9", "Standard", "Workbench", "1", "1.0", 1
+            ),
+            _runtime(
+                "py-wb-std-1b", "Python 3.9", "Standard", "Workbench", "1", "1.0", 2
+            ),
+            _runtime(
+                "py-wb-std-2", "Python 3.9", "Standard", "Workbench", "2", "2.0", 3
+            ),
+            _runtime(
+                "py-jl-std-1", "Python 3.9", "Standard", "JupyterLab", "1", "1.0", 4
+            ),
+            _runtime(
+                "py-wb-nv-1", "Python 3.9", "Nvidia GPU", "Workbench", "1", "1.1", 5
+            ),
+            _runtime("r-wb-std-1", "R 4.1", "Standard", "Workbench", "1", "1.0", 1),
+            {"kernel": "Scala", "edition": "Standard", "editor": "Workbench"},
+        ]
+        self.index = build_runtime_index(self.runtimes)
+
+    def test_matches_baseline_tiers(self):
+        values = {
+            "kernel": ["Python 3.9", "R 4.1", "Scala", "Go"],
+            "edition": ["Standard", "Nvidia GPU", "Other"],
+            "editor": ["Workbench", "JupyterLab", "Other"],
+            "short": ["1", "2", "3"],
+            "full": ["1.0", "1.1", "2.0", "9.9"],
+        }
+        for kernel, edition, editor, short, full in itertools.product(*values.values()):
+            self.assertEqual(
+                get_best_runtime(self.index, edition, editor, kernel, short, full),
+                _baseline_best_runtime(
+                    self.runtimes, edition, editor, kernel, short, full
+                ),
+                (kernel, edition, editor, short, full),
+            )
+
+    def test_first_runtime_wins_a_tie(self):
+        self.assertEqual(
+            get_best_runtime(
+                self.index, "Standard", "Workbench", "Python 3.9", "1", "1.0"
+            ),
+            "py-wb-std-1",
+        )
+
+    def test_falls_back_to_kernel_and_editor(self):
+        self.assertEqual(
+            get_best_runtime(
+                self.index, "Other", "JupyterLab", "Python 3.9", "1", "1.0"
+            ),
+            "py-jl-std-1",
+        )
+
+    def test_no_match(self):
+        self.assertIsNone(
+            get_best_runtime(self.index, "Standard", "Workbench", "Go", "1", "1.0")
+        )
+
+    def test_find_runtime_by_id_keeps_first_runtime(self):
+        runtime_by_id = build_runtime_id_map(self.runtimes)
+        self.assertEqual(
+            find_runtime_by_id(runtime_by_id, 1),
+            {
+                "runtime_kernel": "Python 3.9",
+                "runtime_edition": "Standard",
+                "runtime_editor": "Workbench",
+                "runtime_fullversion": "1.0",
+                "runtime_shortversion": "1",
+            },
+        )
+        self.assertIsNone(find_runtime_by_id(runtime_by_id, 99))
+
+
+class TestWriteJsonFile(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, "project-metadata.json")
+        self.data = {"name": "project", "env": {"KEY": "value"}, "ids": [1, 2]}
+
+    def test_file_is_owner_only(self):
+        write_json_file(self.path, self.data)
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o600)
+
+    def test_symlink_at_target_is_replaced(self):
+        victim = os.path.join(self.tmp.name, "victim.txt")
+        with open(victim, "w") as f:
+            f.write("untouched")
+        os.symlink(victim, self.path)
+        write_json_file(self.path, self.data)
+        self.assertFalse(os.path.islink(self.path))
+        with open(victim) as f:
+            self.assertEqual(f.read(), "untouched")
+
+    def test_no_temporary_file_left_when_serialization_fails(self):
+        with self.assertRaises(TypeError):
+            write_json_file(self.path, {"value": object()})
+        self.assertEqual(os.listdir(self.tmp.name), [])
+
+    def test_output_format(self):
+        write_json_file(self.path, self.data)
+        with open(self.path, "rb") as f:
+            self.assertEqual(
+                f.read(), json.dumps(self.data, separators=(",", ":")).encode("utf-8")
+            )
+
+
+class TestCompareMetadata(unittest.TestCase):
+    def test_reports_differing_values(self):
+        shared = {"key": ["a"]}
+        _, differences = compare_metadata(
+            [
+                {
+                    "name": "job",
+                    "cpu": 2,
+                    "script": "run.py",
+                    "memory": "1",
+                    "env": shared,
+                    "kernel": "python3",
+                    "owner": "dest",
+                }
+            ],
+            [
+                {
+                    "name": "job",
+                    "cpu": "2",
+                    "script": "main.py",
+                    "memory": 1,
+                    "env": shared,
+                    "kernel": None,
+                    "owner": "source",
+                }
+            ],
+            [],
+            [],
+            skip_field=frozenset({"owner"}),
+        )
+        self.assertEqual(
+            differences,
+            {"job": ["script value in destination is run.py, and source is main.py"]},
+        )
+
+    def test_skip_field_accepts_any_iterable(self):
+        for skip_field in (["owner"], ("owner",), {"owner"}, frozenset({"owner"})):
+            _, differences = compare_metadata(
+                [{"name": "job", "owner": "dest"}],
+                [{"name": "job", "owner": "source"}],
+                [],
+                [],
+                skip_field=skip_field,
+            )
+            self.assertEqual(differences, {}, skip_field)
+
+    def test_names_missing_from_either_side_are_skipped(self):
+        _, differences = compare_metadata(
+            [{"name": "only-dest", "cpu": 1}],
+            [{"name": "only-source", "cpu": 2}],
+            [],
+            [],
+        )
+        self.assertEqual(differences, {})
+
+    def test_list_difference_is_sorted_and_tolerates_none(self):
+        data_list_diff, _ = compare_metadata([], [], ["b"], ["c", None, "a", "b"])
+        self.assertEqual(data_list_diff, [None, "a", "c"])
@@ -0,0 +1,51 @@
+import time
+import unittest
+
+from cmlutils.script_models import ValidationResponse, ValidationResponseStatus
+from cmlutils.validator import ImportValidators, run_validators
+
+
+class _StubValidator(ImportValidators):
+    def __init__(self, name, status=ValidationResponseStatus.PASSED, delay=0):
+        self.name = name
+        self.status = status
+        self.delay = delay
+        self.calls = 0
+
+    def validate(self) -> ValidationResponse:
+        self.calls += 1
+        time.sleep(self.delay)
+        return ValidationResponse(self.name, "", self.status)
+
+
+class _LocalStubValidator(_StubValidator):
+    is_local = True
+
+
+class TestRunValidators(unittest.TestCase):
+    def test_failed_local_validator_skips_remote_validators(self):
+        remote = _StubValidator("remote")
+        local = _LocalStubValidator("local", status=ValidationResponseStatus.FAILED)
+        later_local = _LocalStubValidator("later-local")
+
+        responses = run_validators([remote, local, later_local])
+
+        self.assertEqual([r.validation_name for r in responses], ["local"])
+        self.assertEqual(remote.calls, 0)
+        self.assertEqual(later_local.calls, 0)
+
+    def test_remote_responses_keep_validator_order(self):
+        validators = [
+            _StubValidator("slow", delay=0.05),
+            _LocalStubValidator("local"),
+            _StubValidator("medium", delay=0.02),
+            _StubValidator("fast"),
+        ]
+
+        responses = run_validators(validators)
+
+        self.assertEqual(
+            [r.validation_name for r in responses],
+            ["local", "slow", "medium", "fast"],
+        )
+        self.assertTrue(all(v.calls == 1 for v in validators))